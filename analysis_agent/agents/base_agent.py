@@ -1,16 +1,268 @@
 """Base Agent class with standardized logging and metrics tracking."""
 
+import asyncio
+import atexit
+import hashlib
 import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
 import time
-from typing import Optional, List
+from collections import OrderedDict
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime
 
+from analysis_agent.core.config import get_settings
+from analysis_agent.core.llm_provider import LLMFactory
 from analysis_agent.core.models import AgentMetrics
 
+# Default settings shared by agents constructed without explicit settings,
+# loaded once instead of re-reading the environment per instantiation.
+_default_settings = None
+
+
+def _get_cached_settings():
+    global _default_settings
+    if _default_settings is None:
+        _default_settings = get_settings()
+    return _default_settings
+
+# Providers report failure by returning sentinel strings rather than
+# raising (see GeminiProvider.generate / EncapsulatedCLIProvider.execute),
+# so except clauses never see them; the retry loops and the response cache
+# classify provider failures from the returned text instead.
+_ERROR_SENTINEL_PREFIXES = ("Error generating content:", "CLI Execution Failed:")
+_TRANSIENT_ERROR_MARKERS = ("429", "RESOURCE_EXHAUSTED", "500", "503", "Connection")
+
+
+def _is_transient_llm_error(error: Exception) -> bool:
+    """Whether an LLM failure is worth retrying (rate limit / network blip)."""
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    error_str = str(error)
+    return any(marker in error_str for marker in _TRANSIENT_ERROR_MARKERS)
+
+
+def _is_transient_sentinel(response: str) -> bool:
+    """Whether a returned provider error sentinel reports a transient failure."""
+    return (
+        response.startswith(_ERROR_SENTINEL_PREFIXES)
+        and any(marker in response for marker in _TRANSIENT_ERROR_MARKERS)
+    )
+
+
+def _retry_delay(attempt: int) -> float:
+    """Jittered exponential backoff delay for a retry attempt."""
+    return min(30.0, 0.5 * (2 ** attempt)) * (0.5 + random.random())
+
+
+class _MicroBatcher:
+    """Coalesces concurrent async LLM requests into batched provider calls.
+
+    Requests arriving within a short sliding window (llm_batch_window_ms)
+    are grouped, up to llm_batch_max_size per batch, and dispatched through
+    the provider's generate_batch in one go. Each caller awaits its own
+    future and gets back only its response.
+    """
+
+    def __init__(self, provider, window_s: float, max_size: int, max_workers: int):
+        self._provider = provider
+        self._window_s = window_s
+        self._max_size = max_size
+        self._max_workers = max_workers
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, prompt: str, image_paths: Optional[List[str]]) -> str:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((prompt, image_paths, future))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+        return await future
+
+    async def _drain(self):
+        loop = asyncio.get_running_loop()
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+            deadline = loop.time() + self._window_s
+            while len(batch) < self._max_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                responses = await asyncio.to_thread(
+                    self._provider.generate_batch,
+                    [item[0] for item in batch],
+                    [item[1] for item in batch],
+                    self._max_workers,
+                )
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, _, future), response in zip(batch, responses):
+                    if not future.done():
+                        future.set_result(response)
+
+
+# Micro-batchers keyed by (event loop, provider) - like the semaphores,
+# they hold loop-bound primitives.
+_microbatchers: Dict[Tuple[int, int], _MicroBatcher] = {}
+
+
+def _get_microbatcher(provider, settings) -> _MicroBatcher:
+    key = (id(asyncio.get_running_loop()), id(provider))
+    batcher = _microbatchers.get(key)
+    if batcher is None:
+        batcher = _MicroBatcher(
+            provider,
+            window_s=settings.llm_batch_window_ms / 1000.0,
+            max_size=settings.llm_batch_max_size,
+            max_workers=getattr(settings, "llm_max_concurrency", 4),
+        )
+        _microbatchers[key] = batcher
+    return batcher
+
+
+# Process-wide LLM response cache shared by all agents: identical
+# (prompt, image contents) calls are served from memory instead of
+# re-hitting the provider. Image digests are memoized on (mtime, size)
+# so repeated references to the same frame file hash only once.
+_response_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+_image_digests: Dict[Tuple[str, int, int], str] = {}
+
+
+def _file_digest(path: str) -> str:
+    """Content digest of an image file, memoized on (path, mtime, size)."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return path  # Missing file - fall back to the path itself
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    digest = _image_digests.get(key)
+    if digest is None:
+        hasher = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+        _image_digests[key] = digest
+    return digest
+
+
+def _is_cacheable_response(response: str) -> bool:
+    """Whether a provider response is a real result worth caching.
+
+    Rejects empty / "{}" placeholder responses and the error sentinels
+    providers return instead of raising, so a transient rate limit or
+    blocked response doesn't poison the cache for the rest of the run.
+    """
+    if not response or response == "{}":
+        return False
+    return not response.startswith(_ERROR_SENTINEL_PREFIXES)
+
+
+def _response_cache_key(prompt: str, image_paths: Optional[List[str]]) -> bytes:
+    parts = [prompt]
+    if image_paths:
+        parts.extend(_file_digest(p) for p in image_paths)
+    return hashlib.blake2b('|'.join(parts).encode(), digest_size=16).digest()
+
+
+def _response_cache_get(key: bytes) -> Optional[str]:
+    with _response_cache_lock:
+        response = _response_cache.get(key)
+        if response is not None:
+            _response_cache.move_to_end(key)
+        return response
+
+
+def _response_cache_put(key: bytes, response: str, max_size: int) -> None:
+    with _response_cache_lock:
+        _response_cache[key] = response
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > max_size:
+            _response_cache.popitem(last=False)
+
+
+# Shared logging setup: agent loggers are children ("VAA.<name>") of a
+# single "VAA" parent, attached exactly once. The parent gets a
+# QueueHandler so emitting a record is just an enqueue; formatting and
+# stream I/O happen on a background QueueListener thread instead of
+# blocking the calling (event loop) thread.
+_LOG_LOCK = threading.Lock()
+_VAA_LOGGER_NAME = "VAA"
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _get_agent_logger(agent_name: str) -> logging.Logger:
+    """Get the child logger for an agent, setting up the parent once."""
+    global _log_listener
+    parent = logging.getLogger(_VAA_LOGGER_NAME)
+    if not parent.handlers:
+        with _LOG_LOCK:
+            if not parent.handlers:  # re-check under the lock
+                formatter = logging.Formatter(
+                    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                    datefmt='%Y-%m-%d %H:%M:%S'
+                )
+                stream_handler = logging.StreamHandler()
+                stream_handler.setFormatter(formatter)
+
+                log_queue: queue.SimpleQueue = queue.SimpleQueue()
+                _log_listener = logging.handlers.QueueListener(
+                    log_queue, stream_handler, respect_handler_level=True
+                )
+                _log_listener.start()
+                atexit.register(_log_listener.stop)
+
+                parent.addHandler(logging.handlers.QueueHandler(log_queue))
+                parent.setLevel(logging.INFO)
+                # Prevent duplicate logs - don't propagate to root logger
+                parent.propagate = False
+    return logging.getLogger(f"{_VAA_LOGGER_NAME}.{agent_name}")
+
+# One-shot guard so warmup work runs at most once per process.
+_warmed_up = threading.Event()
+
+# Per-event-loop semaphores capping concurrent LLM calls across all agents.
+# Keyed by loop id because asyncio primitives are bound to the loop that
+# created them.
+_llm_semaphores: Dict[int, asyncio.Semaphore] = {}
+
+
+def _get_llm_semaphore(max_concurrency: int) -> asyncio.Semaphore:
+    """Get (or lazily create) the LLM semaphore for the running event loop."""
+    loop_id = id(asyncio.get_running_loop())
+    sem = _llm_semaphores.get(loop_id)
+    if sem is None:
+        sem = asyncio.Semaphore(max_concurrency)
+        _llm_semaphores[loop_id] = sem
+    return sem
+
 
 class BaseAgent:
     """Base class for all agents with standardized logging and metrics."""
-    
+
+    # Subclasses without their own __slots__ still get a __dict__ for
+    # agent-specific attributes; the shared hot counters live in slots.
+    __slots__ = (
+        'agent_name', 'logger', 'llm_calls', 'llm_cache_hits',
+        'llm_retries', 'total_time', 'settings', 'llm',
+    )
+
     def __init__(self, agent_name: str, settings: Optional['Settings'] = None):
         """
         Initialize base agent.
@@ -19,18 +271,41 @@ class BaseAgent:
             agent_name: Name of the agent (e.g., "PLANNING", "VISION", "OCR")
             settings: Application settings (optional)
         """
-        self.agent_name = agent_name
+        # Interned so metric records and phase-dict keys share one string
+        # object and compare by identity.
+        self.agent_name = sys.intern(agent_name)
         self.logger = self._setup_logger()
         self.llm_calls = 0
+        self.llm_cache_hits = 0
+        self.llm_retries = 0
         self.total_time = 0.0
-        
+
         # Initialize LLM Provider
-        from analysis_agent.core.config import get_settings
-        from analysis_agent.core.llm_provider import LLMFactory
-        
-        self.settings = settings or get_settings()
+        self.settings = settings or _get_cached_settings()
         self.llm = LLMFactory.create_provider(self.settings)
 
+    @classmethod
+    def warmup(cls, settings: Optional['Settings'] = None) -> None:
+        """
+        Pre-warm shared state before the first real agent call.
+
+        Constructs the cached provider (TLS handshake, client setup), sends
+        a tiny ping generation, and primes the shared logger, so cold-start
+        latency is paid up front instead of inside the first timed phase.
+        Safe to call multiple times; only the first call does work.
+        """
+        if _warmed_up.is_set():
+            return
+        _warmed_up.set()
+        logger = _get_agent_logger("WARMUP")
+        resolved = settings or _get_cached_settings()
+        try:
+            provider = LLMFactory.create_provider(resolved)
+            provider.generate("ping")
+            logger.info("LLM provider warmed up")
+        except Exception as e:
+            logger.warning("Provider warmup failed (continuing cold): %s", e)
+
     def generate_llm_response(self, prompt: str, image_paths: Optional[List[str]] = None) -> str:
         """
         Generate text response from LLM using the configured provider.
@@ -42,35 +317,244 @@ class BaseAgent:
         Returns:
             Generated text response
         """
+        cache_key = self._llm_cache_lookup_key(prompt, image_paths)
+        if cache_key is not None:
+            cached = _response_cache_get(cache_key)
+            if cached is not None:
+                self.llm_cache_hits += 1
+                return cached
+
         self.track_llm_call()
         try:
-            return self.llm.generate(prompt, image_paths)
+            response = self._generate_with_retry(prompt, image_paths)
         except Exception as e:
-            self.logger.error(f"LLM Generation failed: {e}")
+            self.logger.error("LLM Generation failed: %s", e)
             raise
-    
+        if cache_key is not None and _is_cacheable_response(response):
+            _response_cache_put(cache_key, response, self.settings.llm_cache_size)
+        return response
+
+    def _generate_with_retry(self, prompt: str, image_paths: Optional[List[str]]) -> str:
+        """Call the provider, retrying transient failures with jittered backoff.
+
+        Transient failures show up two ways: raised exceptions, and the
+        error sentinels providers return instead of raising. Both are
+        retried; a sentinel surviving the last attempt is returned as-is,
+        preserving the provider's return-not-raise contract.
+        """
+        max_retries = getattr(self.settings, "agent_max_retries", 3)
+        for attempt in range(max_retries + 1):
+            try:
+                response = self.llm.generate(prompt, image_paths)
+            except Exception as e:
+                if attempt >= max_retries or not _is_transient_llm_error(e):
+                    raise
+                delay = _retry_delay(attempt)
+                self.llm_retries += 1
+                self.logger.warning(
+                    "Transient LLM error (%s), retry %d/%d in %.1fs",
+                    e, attempt + 1, max_retries, delay
+                )
+                time.sleep(delay)
+                continue
+            if attempt < max_retries and _is_transient_sentinel(response):
+                delay = _retry_delay(attempt)
+                self.llm_retries += 1
+                self.logger.warning(
+                    "Transient LLM error sentinel (%.120s), retry %d/%d in %.1fs",
+                    response, attempt + 1, max_retries, delay
+                )
+                time.sleep(delay)
+                continue
+            return response
+
+    async def _agenerate_with_retry(self, prompt: str, image_paths: Optional[List[str]]) -> str:
+        """Async counterpart of _generate_with_retry."""
+        max_retries = getattr(self.settings, "agent_max_retries", 3)
+        for attempt in range(max_retries + 1):
+            try:
+                response = await self.llm.agenerate(prompt, image_paths)
+            except Exception as e:
+                if attempt >= max_retries or not _is_transient_llm_error(e):
+                    raise
+                delay = _retry_delay(attempt)
+                self.llm_retries += 1
+                self.logger.warning(
+                    "Transient LLM error (%s), retry %d/%d in %.1fs",
+                    e, attempt + 1, max_retries, delay
+                )
+                await asyncio.sleep(delay)
+                continue
+            if attempt < max_retries and _is_transient_sentinel(response):
+                delay = _retry_delay(attempt)
+                self.llm_retries += 1
+                self.logger.warning(
+                    "Transient LLM error sentinel (%.120s), retry %d/%d in %.1fs",
+                    response, attempt + 1, max_retries, delay
+                )
+                await asyncio.sleep(delay)
+                continue
+            return response
+
+    def generate_llm_response_batch(
+        self,
+        prompts: List[str],
+        image_paths_list: Optional[List[Optional[List[str]]]] = None
+    ) -> List[str]:
+        """
+        Generate responses for several prompts in one batched provider call.
+
+        Cached entries are filled from the response cache; only misses are
+        dispatched, and the whole batch counts as a single tracked LLM call.
+
+        Args:
+            prompts: Text prompts, one per request
+            image_paths_list: Optional per-prompt image path lists
+
+        Returns:
+            Responses in the same order as the prompts
+        """
+        if image_paths_list is None:
+            image_paths_list = [None] * len(prompts)
+
+        responses: List[Optional[str]] = [None] * len(prompts)
+        miss_indices = []
+        cache_keys = []
+        for i, (prompt, image_paths) in enumerate(zip(prompts, image_paths_list)):
+            key = self._llm_cache_lookup_key(prompt, image_paths)
+            cache_keys.append(key)
+            cached = _response_cache_get(key) if key is not None else None
+            if cached is not None:
+                self.llm_cache_hits += 1
+                responses[i] = cached
+            else:
+                miss_indices.append(i)
+
+        if miss_indices:
+            self.track_llm_call()
+            try:
+                batch_responses = self.llm.generate_batch(
+                    [prompts[i] for i in miss_indices],
+                    [image_paths_list[i] for i in miss_indices],
+                    max_workers=getattr(self.settings, "llm_max_concurrency", 4),
+                )
+            except Exception as e:
+                self.logger.error("Batch LLM Generation failed: %s", e)
+                raise
+            for i, response in zip(miss_indices, batch_responses):
+                responses[i] = response
+                if cache_keys[i] is not None and _is_cacheable_response(response):
+                    _response_cache_put(cache_keys[i], response, self.settings.llm_cache_size)
+
+        return responses
+
+    def _llm_cache_lookup_key(self, prompt: str, image_paths: Optional[List[str]]) -> Optional[bytes]:
+        """Cache key for an LLM call, or None when caching is disabled."""
+        if not getattr(self.settings, "llm_cache_enabled", True):
+            return None
+        return _response_cache_key(prompt, image_paths)
+
+    async def agenerate_llm_response(self, prompt: str, image_paths: Optional[List[str]] = None) -> str:
+        """
+        Async variant of generate_llm_response.
+
+        Awaits the provider's async path so callers (e.g. the orchestrator)
+        can overlap independent agent calls with asyncio.gather.
+
+        Args:
+            prompt: Text prompt
+            image_paths: Optional list of paths to images for vision tasks
+
+        Returns:
+            Generated text response
+        """
+        cache_key = self._llm_cache_lookup_key(prompt, image_paths)
+        if cache_key is not None:
+            cached = _response_cache_get(cache_key)
+            if cached is not None:
+                self.llm_cache_hits += 1
+                return cached
+
+        if getattr(self.settings, "llm_batch_window_ms", 0) > 0:
+            # Opt-in micro-batching: coalesce with other in-flight requests
+            # (the batcher bounds its own concurrency).
+            self.track_llm_call()
+            try:
+                response = await _get_microbatcher(self.llm, self.settings).submit(prompt, image_paths)
+            except Exception as e:
+                self.logger.error("LLM Generation failed: %s", e)
+                raise
+        else:
+            sem = _get_llm_semaphore(getattr(self.settings, "llm_max_concurrency", 4))
+            async with sem:
+                self.track_llm_call()
+                try:
+                    response = await self._agenerate_with_retry(prompt, image_paths)
+                except Exception as e:
+                    self.logger.error("LLM Generation failed: %s", e)
+                    raise
+        if cache_key is not None and _is_cacheable_response(response):
+            _response_cache_put(cache_key, response, self.settings.llm_cache_size)
+        return response
+
+    async def agenerate_llm_response_stream(
+        self,
+        prompt: str,
+        image_paths: Optional[List[str]] = None,
+        on_chunk=None
+    ) -> str:
+        """
+        Generate a response via the provider's streaming API.
+
+        The provider stream is consumed on a worker thread; each chunk is
+        forwarded to on_chunk(text) on the event loop as it arrives, so
+        callers can report progress (or begin incremental parsing) while
+        the model is still generating. Returns the full concatenated
+        response and participates in the shared response cache.
+
+        Args:
+            prompt: Text prompt
+            image_paths: Optional list of paths to images for vision tasks
+            on_chunk: Optional callable invoked with each text chunk
+
+        Returns:
+            Complete generated text response
+        """
+        cache_key = self._llm_cache_lookup_key(prompt, image_paths)
+        if cache_key is not None:
+            cached = _response_cache_get(cache_key)
+            if cached is not None:
+                self.llm_cache_hits += 1
+                if on_chunk is not None:
+                    on_chunk(cached)
+                return cached
+
+        loop = asyncio.get_running_loop()
+
+        def consume() -> str:
+            chunks = []
+            for chunk in self.llm.generate_stream(prompt, image_paths):
+                chunks.append(chunk)
+                if on_chunk is not None:
+                    loop.call_soon_threadsafe(on_chunk, chunk)
+            return ''.join(chunks)
+
+        sem = _get_llm_semaphore(getattr(self.settings, "llm_max_concurrency", 4))
+        async with sem:
+            self.track_llm_call()
+            try:
+                response = await asyncio.to_thread(consume)
+            except Exception as e:
+                self.logger.error("Streaming LLM Generation failed: %s", e)
+                raise
+        if cache_key is not None and _is_cacheable_response(response):
+            _response_cache_put(cache_key, response, self.settings.llm_cache_size)
+        return response
+
     def _setup_logger(self) -> logging.Logger:
         """Setup standardized logger for this agent."""
-        logger = logging.getLogger(f"{self.agent_name}")
-        
-        # Prevent duplicate logs - don't propagate to root logger
-        logger.propagate = False
-        
-        # Only add handler if none exists
-        if not logger.handlers:
-            # Create custom formatter
-            formatter = logging.Formatter(
-                '%(asctime)s - VAA - %(name)s - %(levelname)s - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            
-            handler = logging.StreamHandler()
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            logger.setLevel(logging.INFO)
-        
-        return logger
-    
+        return _get_agent_logger(self.agent_name)
+
     def track_llm_call(self):
         """Increment LLM call counter."""
         self.llm_calls += 1
@@ -81,47 +565,36 @@ class BaseAgent:
             agent_name=self.agent_name,
             time_taken=time_taken,
             llm_calls=llm_calls,
-            phase=phase
+            phase=sys.intern(phase)
         )
     
+    @contextmanager
     def timed_operation(self, operation_name: str):
         """
         Context manager for timing operations.
-        
+
+        Generator-based so entering a timed block allocates a couple of
+        locals instead of a dedicated timer object.
+
         Usage:
             with self.timed_operation("Analysis"):
                 # do work
         """
-        return TimedOperation(self, operation_name)
-
-
-class TimedOperation:
-    """Context manager for timing agent operations."""
-    
-    def __init__(self, agent: BaseAgent, operation_name: str):
-        self.agent = agent
-        self.operation_name = operation_name
-        self.start_time = None
-        self.llm_calls_start = 0
-    
-    def __enter__(self):
-        self.start_time = time.time()
-        self.llm_calls_start = self.agent.llm_calls
-        self.agent.logger.info(f"Starting {self.operation_name}...")
-        return self
-    
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        elapsed = time.time() - self.start_time
-        llm_calls = self.agent.llm_calls - self.llm_calls_start
-        
-        if exc_type is None:
-            self.agent.logger.info(
-                f"Completed {self.operation_name} in {elapsed:.2f}s "
-                f"({llm_calls} LLM calls)"
-            )
+        # Monotonic, nanosecond-resolution clock - time.time() is neither
+        # and skews short-operation metrics.
+        start_ns = perf_counter_ns()
+        llm_calls_start = self.llm_calls
+        self.logger.info("Starting %s...", operation_name)
+        try:
+            yield
+        except BaseException as e:
+            elapsed = (perf_counter_ns() - start_ns) * 1e-9
+            self.logger.error("Failed %s after %.2fs: %s", operation_name, elapsed, e)
+            raise
         else:
-            self.agent.logger.error(
-                f"Failed {self.operation_name} after {elapsed:.2f}s: {exc_val}"
-            )
-        
-        return False  # Don't suppress exceptions
\ No newline at end of file
+            elapsed = (perf_counter_ns() - start_ns) * 1e-9
+            llm_calls = self.llm_calls - llm_calls_start
+            self.logger.info(
+                "Completed %s in %.2fs (%d LLM calls)",
+                operation_name, elapsed, llm_calls
+            )
\ No newline at end of file
@@ -18,10 +18,14 @@ VerificationAgent which uses LLM-based semantic analysis for accuracy.
 """
 
 import asyncio
-import json
+import hashlib
+import time
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import re
+
+import cv2
+import numpy as np
 from analysis_agent.utils.json_utils import try_parse_json
 
 
@@ -31,6 +35,153 @@ from analysis_agent.core.models import (
     StepEvidence, StepStatus
 )
 from analysis_agent.core.config import Settings
+from analysis_agent.core.llm_provider import preload_image_bytes
+
+# Precompiled keyword-extraction pattern - _extract_keywords runs once per
+# step, so avoid per-call pattern lookups. Quoted phrases and bare words
+# come out of a single scan via alternation; group 1 is a quoted phrase,
+# group 2 a word of 3+ characters.
+_KW_RE = re.compile(r'"([^"]+)"|\b(\w{3,})\b')
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to',
+    'for', 'of', 'with', 'is', 'are', 'was', 'were', 'be', 'been',
+    'that', 'this', 'it', 'as', 'by', 'from', 'should', 'will'
+})
+
+
+_COMPREHENSIVE_PROMPT_TEMPLATE = """You are analyzing a UI test video to create a COMPREHENSIVE TIMELINE of all events.
+
+**Your Task:**
+Analyze the frames chronologically and describe EVERYTHING you observe. Create a detailed timeline of ALL events.
+
+For each significant event, note:
+1. **Navigation & Page Loads**: URLs, page changes, redirects
+2. **User Interactions**: Clicks, typing in inputs, selecting options
+3. **UI State Changes**: Modals, dropdowns, filters, tooltips appearing/disappearing
+4. **Content Updates**: Search results, product listings, dynamic text
+5. **Visual Elements**: Buttons, inputs, navigation menus, icons visible at each stage
+6. **Text Content**: Any readable text (combine with OCR data)
+7. **Assertions/Validations**: Filter selections, result counts, validation messages
+
+**CRITICAL - Negative Observations:**
+When analyzing, you MUST explicitly note when UI elements are:
+- MISSING (expected in test but not found in video)
+- PRESENT (found as expected)
+- DIFFERENT (found but in unexpected state)
+
+For filter/option selections and assertions:
+- List ALL available options you can actually see in each frame
+- Explicitly state if expected options are NOT visible or NOT available
+- Note checkbox/selection states (checked/unchecked, selected/unselected)
+- Be ACCURATE - do NOT assume elements exist if you cannot see them
+- Use EXACT phrases: "X is NOT visible", "X is NOT available", "X does NOT appear"
+
+**MANDATORY NEGATIVE REPORTING:**
+If a test step mentions an element (button, filter, option, text) but you CANNOT see it:
+- You MUST explicitly state: "[Element Name] is NOT visible" or "[Element Name] is NOT available"
+- Do NOT skip or ignore missing elements
+- This is critical for detecting test failures
+
+Example of GOOD analysis:
+✓ "Neck filter section shows available options: 'Crew Neck', 'V-Neck'. IMPORTANT: 'Turtle Neck' option is NOT visible in the available filters."
+✓ "Search results show 2 items for 'Rainbow sweater'. No filters are currently applied."
+✓ "Filter dropdown expanded. Available options: 'Crew Neck' (unchecked), 'V-Neck' (unchecked). NOTE: 'Turtle Neck' is NOT available as an option."
+
+Example of BAD analysis (AVOID):
+✗ "Turtle Neck filter is applied" (when you cannot see this option exists)
+✗ "Filter section visible" (too vague - list actual available options)
+✗ Omitting mention of missing elements entirely
+
+**Output Format (JSON):**
+```json
+{{
+    "narrative": "Brief overall summary of what the test accomplishes",
+    "key_observations": [
+        "Important observation 1",
+        "Important observation 2",
+        ...
+    ],
+    "events": [
+        {{
+            "timestamp": 0.0,
+            "frame_number": 0,
+            "event_type": "navigation",
+            "description": "Detailed description of what's happening",
+            "ui_elements": ["search icon", "navigation bar", "logo"],
+            "text_visible": ["Wrangler", "Sign In"],
+            "confidence": 0.95
+        }},
+        {{
+            "timestamp": 10.5,
+            "frame_number": 10,
+            "event_type": "click",
+            "description": "User clicked the search icon to activate search bar",
+            "ui_elements": ["search bar expanded", "search input field", "close icon"],
+            "text_visible": ["Start typing to search"],
+            "confidence": 1.0
+        }},
+        ...
+    ]
+}}
+```
+
+**Event Types:**
+- `navigation`: Page loads, URL changes
+- `click`: Button/link clicks, UI interactions
+- `type`: Text input, form filling
+- `ui_change`: Modals, dropdowns, filters, visual state changes
+- `assertion`: Validation checks, filter states, result verification
+
+**Important:**
+- Be thorough - capture ALL observable changes
+- Include timestamps from the frames
+- Note UI elements visible at each stage
+- Combine visual analysis with OCR text
+- Provide high confidence (0.9-1.0) for clear observations
+- This timeline will be used to verify all test steps, so completeness is critical
+
+**Video Information:**
+- Frames analyzed: {frame_count} key frames
+- Timestamps: {first_timestamp} through {last_timestamp}
+- Total duration: {total_duration} seconds
+
+**Test Steps (Expected Sequence):**
+{steps_summary}
+
+**OCR Text Detected:**
+{ocr_summary}
+
+Analyze now and provide the comprehensive timeline."""
+
+
+def _extract_json_block(text: str) -> str:
+    """Cut the JSON object out of an LLM response in one pass of indices.
+
+    Replaces the old membership-test + split + find/rfind preamble, which
+    re-scanned (and re-allocated) the response several times. Fence bounds
+    and brace bounds are located with C-level index searches and the text
+    is sliced exactly once.
+    """
+    start = 0
+    end = len(text)
+
+    fence = text.find("```json")
+    if fence >= 0:
+        start = fence + 7
+    else:
+        fence = text.find("```")
+        if fence >= 0:
+            start = fence + 3
+    if fence >= 0:
+        close = text.find("```", start)
+        if close >= 0:
+            end = close
+
+    brace_start = text.find("{", start, end)
+    brace_end = text.rfind("}", start, end)
+    if brace_start >= 0 and brace_end > brace_start:
+        return text[brace_start:brace_end + 1]
+    return text[start:end].strip()
 
 
 class ComprehensiveVisionAgent(BaseAgent):
@@ -52,46 +203,139 @@ class ComprehensiveVisionAgent(BaseAgent):
     ) -> List[VideoFrame]:
         """
         Extract key frames using strategic sampling.
-        
+
         Strategy:
         - Always include first and last frames
-        - Sample evenly across video duration
-        - TODO: Add scene change detection for better frame selection
-        
+        - Prefer frames at scene changes (histogram diffs), falling back
+          to even sampling when scene detection is disabled or fails
+
         Args:
             all_frames: All extracted frames
             max_key_frames: Maximum number of key frames to extract
-            
+
         Returns:
             List of strategically selected key frames
         """
         if len(all_frames) <= max_key_frames:
-            self.logger.info(f"Using all {len(all_frames)} frames as key frames")
+            self.logger.info("Using all %d frames as key frames", len(all_frames))
             return all_frames
-        
-        key_frames = []
-        
-        # Always include first frame
-        key_frames.append(all_frames[0])
-        
-        # Sample evenly across middle frames
-        step = len(all_frames) / (max_key_frames - 1)
-        for i in range(1, max_key_frames - 1):
-            idx = int(i * step)
-            if idx < len(all_frames):
-                key_frames.append(all_frames[idx])
-        
-        # Always include last frame
-        if all_frames[-1] not in key_frames:
-            key_frames.append(all_frames[-1])
-        
+
+        indices = None
+        if getattr(self.settings, "key_frame_scene_detection", True):
+            indices = self._select_scene_change_indices(all_frames, max_key_frames)
+
+        if indices is None:
+            # Evenly spaced indices including both endpoints; np.unique drops
+            # duplicates, so first/last frames are included exactly once
+            # without any O(N) membership scan.
+            indices = np.unique(
+                np.linspace(0, len(all_frames) - 1, max_key_frames, dtype=np.int64)
+            )
+        key_frames = [all_frames[i] for i in indices]
+        key_frames = self._dedup_similar_frames(key_frames)
+
         self.logger.info(
-            f"Extracted {len(key_frames)} key frames from {len(all_frames)} total "
-            f"(timestamps: {key_frames[0].timestamp:.1f}s - {key_frames[-1].timestamp:.1f}s)"
+            "Extracted %d key frames from %d total (timestamps: %.1fs - %.1fs)",
+            len(key_frames), len(all_frames),
+            key_frames[0].timestamp, key_frames[-1].timestamp
         )
         
         return key_frames
     
+    def _select_scene_change_indices(
+        self,
+        all_frames: List[VideoFrame],
+        max_key_frames: int
+    ) -> Optional[np.ndarray]:
+        """
+        Pick key-frame indices at the largest visual transitions.
+
+        Computes a 32-bin grayscale histogram per frame, takes the norm of
+        consecutive histogram diffs, and keeps the frames after the largest
+        jumps (plus the first and last frame). Uniform sampling wastes LLM
+        budget on near-duplicate frames while missing transitions.
+
+        Returns:
+            Sorted unique frame indices, or None if scene detection fails
+            (caller falls back to even sampling).
+        """
+        try:
+            histograms = []
+            for frame in all_frames:
+                if not frame.frame_path:
+                    return None
+                image = cv2.imread(frame.frame_path, cv2.IMREAD_GRAYSCALE)
+                if image is None:
+                    return None
+                hist = cv2.calcHist([image], [0], None, [32], [0, 256])
+                histograms.append(hist.ravel() / max(image.size, 1))
+
+            diffs = np.linalg.norm(np.diff(np.stack(histograms), axis=0), axis=1)
+
+            # Frames following the largest diffs; endpoints always included
+            change_count = max_key_frames - 2
+            change_indices = np.argpartition(diffs, -change_count)[-change_count:] + 1
+            indices = np.unique(
+                np.concatenate(([0, len(all_frames) - 1], change_indices))
+            )
+            self.logger.info(
+                "Scene detection selected %d key frames from %d (max diff: %.4f)",
+                len(indices), len(all_frames), diffs.max()
+            )
+            return indices
+        except Exception as e:
+            self.logger.warning("Scene change detection failed, falling back: %s", e)
+            return None
+
+    def _dedup_similar_frames(self, key_frames: List[VideoFrame]) -> List[VideoFrame]:
+        """
+        Drop key frames that are perceptually identical to the previous one.
+
+        UI videos idle on a static page between interactions, so adjacent
+        key frames often carry the same pixels; every duplicate still costs
+        full vision-model tokens. Compares 64-bit difference hashes (dHash,
+        built with cv2/numpy rather than a new imagehash dependency) and
+        drops frames within settings.key_frame_dedup_threshold Hamming bits
+        of the last retained frame. First and last frames are always kept;
+        0 disables dedup.
+        """
+        threshold = getattr(self.settings, "key_frame_dedup_threshold", 4)
+        if threshold <= 0 or len(key_frames) <= 2:
+            return key_frames
+
+        def dhash(path: str) -> Optional[np.ndarray]:
+            image = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+            if image is None:
+                return None
+            small = cv2.resize(image, (9, 8), interpolation=cv2.INTER_AREA)
+            return small[:, 1:] > small[:, :-1]
+
+        try:
+            retained = [key_frames[0]]
+            prev_hash = dhash(key_frames[0].frame_path) if key_frames[0].frame_path else None
+            for frame in key_frames[1:-1]:
+                cur_hash = dhash(frame.frame_path) if frame.frame_path else None
+                if (
+                    prev_hash is not None
+                    and cur_hash is not None
+                    and np.count_nonzero(prev_hash != cur_hash) <= threshold
+                ):
+                    continue
+                retained.append(frame)
+                prev_hash = cur_hash
+            retained.append(key_frames[-1])
+
+            dropped = len(key_frames) - len(retained)
+            if dropped:
+                self.logger.info(
+                    "Perceptual dedup dropped %d near-duplicate key frames "
+                    "(%d remain)", dropped, len(retained)
+                )
+            return retained
+        except Exception as e:
+            self.logger.warning("Key-frame dedup failed, keeping all frames: %s", e)
+            return key_frames
+
     async def analyze_video_comprehensive(
         self,
         key_frames: List[VideoFrame],
@@ -115,18 +359,19 @@ class ComprehensiveVisionAgent(BaseAgent):
             VideoTimeline with comprehensive event narrative
         """
         self.logger.info(
-            f"🎬 Starting comprehensive video analysis "
-            f"({len(key_frames)} frames, {len(test_steps)} steps)"
+            "🎬 Starting comprehensive video analysis (%d frames, %d steps)",
+            len(key_frames), len(test_steps)
         )
         
-        # Prepare frame paths for vision API
-        frame_paths = [str(Path(f.frame_path)) for f in key_frames if f.frame_path and Path(f.frame_path).exists()]
+        # Prepare frame paths for vision API. Extraction already validated
+        # each write, so no per-frame stat() here.
+        frame_paths = [f.frame_path for f in key_frames if f.frame_path]
         
         if not frame_paths:
             self.logger.error("No valid frame paths found")
             return self._create_empty_timeline(key_frames)
         
-        self.logger.info(f"Prepared {len(frame_paths)} frames for analysis")
+        self.logger.info("Prepared %d frames for analysis", len(frame_paths))
         
         # Create comprehensive prompt
         if progress_callback:
@@ -138,39 +383,158 @@ class ComprehensiveVisionAgent(BaseAgent):
             self.logger.info("Making comprehensive vision API call...")
             if progress_callback:
                 progress_callback("Preparing frames for AI analysis...")
-            
+
+            # Read and encode all frames in parallel before the API call,
+            # instead of serially inside the provider
+            await asyncio.to_thread(
+                preload_image_bytes,
+                frame_paths,
+                max_dim=getattr(self.settings, "vision_max_image_dim", 0)
+            )
+
+
             if progress_callback:
                 progress_callback(f"Analyzing {len(frame_paths)} video frames with AI...")
             
-            with self.timed_operation("Comprehensive Vision Analysis"):
-                # Use modular LLM provider
-                response_text = self.generate_llm_response(prompt=prompt, image_paths=frame_paths)
-            
+            cache_path = self._response_cache_path(prompt, frame_paths)
+            response_text = self._read_cached_response(cache_path)
+            cache_miss = response_text is None
+
+            if cache_miss:
+                with self.timed_operation("Comprehensive Vision Analysis"):
+                    # Use modular LLM provider via the async path so the
+                    # event loop (progress callbacks, concurrent videos)
+                    # keeps running during the API call. With a progress
+                    # callback, stream so updates track actual generation.
+                    if progress_callback:
+                        received = 0
+                        last_report = 0.0
+
+                        def report_chunk(chunk: str) -> None:
+                            # Streams arrive as many small chunks; report at
+                            # most every 2s so downstream progress channels
+                            # aren't flooded. Wording deliberately avoids the
+                            # phase-detection substrings the orchestrator keys
+                            # on, so a mid-stream update can't reset the ramp.
+                            nonlocal received, last_report
+                            received += len(chunk)
+                            now = time.monotonic()
+                            if now - last_report < 2.0:
+                                return
+                            last_report = now
+                            progress_callback(
+                                f"Receiving streamed response... ({received} chars)"
+                            )
+
+                        response_text = await self.agenerate_llm_response_stream(
+                            prompt=prompt,
+                            image_paths=frame_paths,
+                            on_chunk=report_chunk,
+                        )
+                    else:
+                        response_text = await self.agenerate_llm_response(prompt=prompt, image_paths=frame_paths)
+            else:
+                self.logger.info("Using cached comprehensive analysis response")
+
             # Parse response into timeline
             if progress_callback:
                 progress_callback("Parsing AI response into timeline...")
-                
+
             timeline = self._parse_timeline_response(
                 response_text,
                 key_frames,
                 ocr_data
             )
-            
+
+            # Cache only after parsing succeeds - persisting a provider
+            # error sentinel or unparseable response would replay the
+            # failure on every future run over the same video.
+            if cache_miss and timeline.events:
+                self._write_cached_response(cache_path, response_text)
+
             if progress_callback:
                 progress_callback("Timeline analysis complete")
             
             self.logger.info(
-                f"✅ Timeline created: {len(timeline.events)} events, "
-                f"{len(timeline.key_observations)} observations"
+                "✅ Timeline created: %d events, %d observations",
+                len(timeline.events), len(timeline.key_observations)
             )
-            self.logger.debug(f"Narrative: {timeline.narrative[:200]}...")
+            self.logger.debug("Narrative: %.200s...", timeline.narrative)
             
             return timeline
             
         except Exception as e:
-            self.logger.error(f"Comprehensive analysis failed: {e}", exc_info=True)
+            self.logger.error("Comprehensive analysis failed: %s", e, exc_info=True)
             return self._create_empty_timeline(key_frames)
     
+    async def analyze_videos_batch(
+        self,
+        jobs: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
+    ) -> List[VideoTimeline]:
+        """
+        Analyze several videos concurrently with a concurrency cap.
+
+        Each job is a dict of analyze_video_comprehensive keyword arguments
+        (key_frames, test_steps, ocr_data, optional progress_callback).
+        Wall-clock for N videos drops from the sum of LLM latencies toward
+        the max, bounded by the semaphore.
+
+        Args:
+            jobs: Per-video keyword-argument dicts
+            max_concurrency: Cap on in-flight analyses
+                (defaults to settings.vision_max_concurrent)
+
+        Returns:
+            Timelines in the same order as the jobs
+        """
+        if max_concurrency is None:
+            max_concurrency = getattr(self.settings, "vision_max_concurrent", 3)
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def analyze_one(job: Dict[str, Any]) -> VideoTimeline:
+            async with sem:
+                return await self.analyze_video_comprehensive(**job)
+
+        return list(await asyncio.gather(*(analyze_one(job) for job in jobs)))
+
+    def _response_cache_path(self, prompt: str, frame_paths: List[str]) -> Optional[Path]:
+        """On-disk cache location for a (prompt, frame contents) pair.
+
+        Returns None when vision_cache_dir is unset (caching disabled).
+        Re-runs over the same video and steps - common in development -
+        then skip the most expensive call in the pipeline entirely.
+        """
+        cache_dir = getattr(self.settings, "vision_cache_dir", None)
+        if not cache_dir:
+            return None
+        hasher = hashlib.blake2b(prompt.encode(), digest_size=16)
+        for path in frame_paths:
+            try:
+                stat = Path(path).stat()
+                hasher.update(f"{path}|{stat.st_mtime_ns}|{stat.st_size}".encode())
+            except OSError:
+                hasher.update(path.encode())
+        return Path(cache_dir) / f"timeline_{hasher.hexdigest()}.txt"
+
+    def _read_cached_response(self, cache_path: Optional[Path]) -> Optional[str]:
+        if cache_path is None or not cache_path.exists():
+            return None
+        try:
+            return cache_path.read_text(encoding='utf-8')
+        except OSError as e:
+            self.logger.warning("Failed to read vision cache: %s", e)
+            return None
+
+    def _write_cached_response(self, cache_path: Optional[Path], response_text: str) -> None:
+        if cache_path is None:
+            return
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(response_text, encoding='utf-8')
+        except OSError as e:
+            self.logger.warning("Failed to write vision cache: %s", e)
+
     def _create_comprehensive_prompt(
         self,
         key_frames: List[VideoFrame],
@@ -178,125 +542,27 @@ class ComprehensiveVisionAgent(BaseAgent):
         ocr_data: Dict[int, List[str]]
     ) -> str:
         """Create detailed prompt for comprehensive analysis."""
-        
-        # Format frame timestamps for context
-        frame_timestamps = [f"{f.timestamp:.1f}s" for f in key_frames]
-        
+
         # Include OCR context
         ocr_summary = self._summarize_ocr_data(ocr_data, key_frames)
-        
+
         # Include test context
         steps_summary = "\n".join([
             f"Step {i+1}: {step.description}"
             for i, step in enumerate(test_steps)
         ])
-        
-        prompt = f"""You are analyzing a UI test video to create a COMPREHENSIVE TIMELINE of all events.
-
-**Video Information:**
-- Frames analyzed: {len(key_frames)} key frames
-- Timestamps: {frame_timestamps[0]} through {frame_timestamps[-1]}
-- Total duration: {key_frames[-1].timestamp:.1f} seconds
-
-**Test Steps (Expected Sequence):**
-{steps_summary}
-
-**OCR Text Detected:**
-{ocr_summary}
-
-**Your Task:**
-Analyze the frames chronologically and describe EVERYTHING you observe. Create a detailed timeline of ALL events.
-
-For each significant event, note:
-1. **Navigation & Page Loads**: URLs, page changes, redirects
-2. **User Interactions**: Clicks, typing in inputs, selecting options
-3. **UI State Changes**: Modals, dropdowns, filters, tooltips appearing/disappearing
-4. **Content Updates**: Search results, product listings, dynamic text
-5. **Visual Elements**: Buttons, inputs, navigation menus, icons visible at each stage
-6. **Text Content**: Any readable text (combine with OCR data)
-7. **Assertions/Validations**: Filter selections, result counts, validation messages
-
-**CRITICAL - Negative Observations:**
-When analyzing, you MUST explicitly note when UI elements are:
-- MISSING (expected in test but not found in video)
-- PRESENT (found as expected)
-- DIFFERENT (found but in unexpected state)
-
-For filter/option selections and assertions:
-- List ALL available options you can actually see in each frame
-- Explicitly state if expected options are NOT visible or NOT available
-- Note checkbox/selection states (checked/unchecked, selected/unselected)
-- Be ACCURATE - do NOT assume elements exist if you cannot see them
-- Use EXACT phrases: "X is NOT visible", "X is NOT available", "X does NOT appear"
-
-**MANDATORY NEGATIVE REPORTING:**
-If a test step mentions an element (button, filter, option, text) but you CANNOT see it:
-- You MUST explicitly state: "[Element Name] is NOT visible" or "[Element Name] is NOT available"
-- Do NOT skip or ignore missing elements
-- This is critical for detecting test failures
-
-Example of GOOD analysis:
-✓ "Neck filter section shows available options: 'Crew Neck', 'V-Neck'. IMPORTANT: 'Turtle Neck' option is NOT visible in the available filters."
-✓ "Search results show 2 items for 'Rainbow sweater'. No filters are currently applied."
-✓ "Filter dropdown expanded. Available options: 'Crew Neck' (unchecked), 'V-Neck' (unchecked). NOTE: 'Turtle Neck' is NOT available as an option."
-
-Example of BAD analysis (AVOID):
-✗ "Turtle Neck filter is applied" (when you cannot see this option exists)
-✗ "Filter section visible" (too vague - list actual available options)
-✗ Omitting mention of missing elements entirely
 
-**Output Format (JSON):**
-```json
-{{
-    "narrative": "Brief overall summary of what the test accomplishes",
-    "key_observations": [
-        "Important observation 1",
-        "Important observation 2",
-        ...
-    ],
-    "events": [
-        {{
-            "timestamp": 0.0,
-            "frame_number": 0,
-            "event_type": "navigation",
-            "description": "Detailed description of what's happening",
-            "ui_elements": ["search icon", "navigation bar", "logo"],
-            "text_visible": ["Wrangler", "Sign In"],
-            "confidence": 0.95
-        }},
-        {{
-            "timestamp": 10.5,
-            "frame_number": 10,
-            "event_type": "click",
-            "description": "User clicked the search icon to activate search bar",
-            "ui_elements": ["search bar expanded", "search input field", "close icon"],
-            "text_visible": ["Start typing to search"],
-            "confidence": 1.0
-        }},
-        ...
-    ]
-}}
-```
-
-**Event Types:**
-- `navigation`: Page loads, URL changes
-- `click`: Button/link clicks, UI interactions
-- `type`: Text input, form filling
-- `ui_change`: Modals, dropdowns, filters, visual state changes
-- `assertion`: Validation checks, filter states, result verification
-
-**Important:**
-- Be thorough - capture ALL observable changes
-- Include timestamps from the frames
-- Note UI elements visible at each stage
-- Combine visual analysis with OCR text
-- Provide high confidence (0.9-1.0) for clear observations
-- This timeline will be used to verify all test steps, so completeness is critical
-
-Analyze now and provide the comprehensive timeline."""
+        # The ~3KB of static instruction text lives in the module-level
+        # template; only the handful of dynamic values is formatted in.
+        return _COMPREHENSIVE_PROMPT_TEMPLATE.format(
+            frame_count=len(key_frames),
+            first_timestamp=f"{key_frames[0].timestamp:.1f}s",
+            last_timestamp=f"{key_frames[-1].timestamp:.1f}s",
+            total_duration=f"{key_frames[-1].timestamp:.1f}",
+            steps_summary=steps_summary,
+            ocr_summary=ocr_summary,
+        )
 
-        return prompt
-    
     def _summarize_ocr_data(
         self,
         ocr_data: Dict[int, List[str]],
@@ -305,13 +571,18 @@ Analyze now and provide the comprehensive timeline."""
         """Summarize OCR findings for prompt."""
         if not ocr_data:
             return "No OCR text detected"
-        
+
         summary_lines = []
+        seen: set = set()  # persistent chrome (nav labels, buttons) recurs every frame
         for frame in key_frames[:10]:  # First 10 key frames
             texts = ocr_data.get(frame.frame_number, [])
-            if texts:
+            # Only surface text not already shown for an earlier frame -
+            # repeats bloat the prompt without adding information
+            novel = [t for t in texts if t not in seen]
+            seen.update(novel)
+            if novel:
                 summary_lines.append(
-                    f"Frame {frame.frame_number} ({frame.timestamp:.1f}s): {', '.join(texts[:8])}"
+                    f"Frame {frame.frame_number} ({frame.timestamp:.1f}s): {', '.join(novel[:8])}"
                 )
         
         if not summary_lines:
@@ -327,21 +598,10 @@ Analyze now and provide the comprehensive timeline."""
     ) -> VideoTimeline:
         """Parse LLM response into VideoTimeline with robust error recovery."""
         try:
-            # Extract JSON from response
-            cleaned_text = response_text.strip()
-            
-            # Handle markdown code blocks
-            if "```json" in cleaned_text:
-                cleaned_text = cleaned_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in cleaned_text:
-                cleaned_text = cleaned_text.split("```")[1].split("```")[0].strip()
-            
-            # Additional cleanup for potential prefixes/suffixes
-            if not cleaned_text.startswith("{") and "{" in cleaned_text:
-                cleaned_text = cleaned_text[cleaned_text.find("{"):]
-            if not cleaned_text.endswith("}") and "}" in cleaned_text:
-                cleaned_text = cleaned_text[:cleaned_text.rfind("}")+1]
-            
+            # Extract JSON from response (fences and brace bounds located
+            # in a single pass, one slice)
+            cleaned_text = _extract_json_block(response_text)
+
             # Using robust repair from json_utils
             data = try_parse_json(cleaned_text)
             
@@ -355,7 +615,7 @@ Analyze now and provide the comprehensive timeline."""
                 try:
                     events.append(TimelineEvent(**event_data))
                 except Exception as e:
-                    self.logger.warning(f"Failed to parse event: {e}")
+                    self.logger.warning("Failed to parse event: %s", e)
                     continue
             
             # Calculate total duration
@@ -369,11 +629,11 @@ Analyze now and provide the comprehensive timeline."""
                 key_observations=data.get("key_observations", [])
             )
             
-            self.logger.info(f"Successfully parsed {len(events)} events from response")
+            self.logger.info("Successfully parsed %d events from response", len(events))
             return timeline
             
         except Exception as e:
-            self.logger.error(f"Failed to parse timeline response: {e}", exc_info=True)
+            self.logger.error("Failed to parse timeline response: %s", e, exc_info=True)
             return self._create_empty_timeline(key_frames)
     
     
@@ -413,11 +673,11 @@ Analyze now and provide the comprehensive timeline."""
         Returns:
             StepEvidence with gathered evidence for VerificationAgent
         """
-        self.logger.debug(f"Gathering evidence for step {step.step_number}: {step.description}")
+        self.logger.debug("Gathering evidence for step %d: %s", step.step_number, step.description)
         
         # Extract keywords from step
         keywords = self._extract_keywords(step.description, step.action)
-        self.logger.debug(f"Keywords: {keywords[:5]}...")
+        self.logger.debug("Keywords: %s...", keywords[:5])
         
         # Calculate minimum timestamp for temporal ordering
         min_timestamp = max(0.0, (previous_step_timestamp or 0.0) + 0.5)
@@ -440,8 +700,8 @@ Analyze now and provide the comprehensive timeline."""
         
         if not matching_events:
             self.logger.warning(
-                f"No matching events found for step {step.step_number} "
-                f"after timestamp {min_timestamp:.1f}s"
+                "No matching events found for step %d after timestamp %.1fs",
+                step.step_number, min_timestamp
             )
             return StepEvidence(
                 found=False,
@@ -459,12 +719,18 @@ Analyze now and provide the comprehensive timeline."""
         
         # Calculate initial confidence based on keyword matching
         # Note: This is preliminary - VerificationAgent may adjust based on semantic analysis
-        desc_lower = best_match.description.lower()
-        text_lower = ' '.join(best_match.text_visible).lower()
-        ui_lower = ' '.join(best_match.ui_elements).lower()
-        combined = f"{desc_lower} {text_lower} {ui_lower}"
-        
-        matched_keywords = sum(1 for kw in keywords if kw.lower() in combined)
+        # Keywords lowered once up front. Single words score via O(1)
+        # lookups in the event's cached token set, falling back to a
+        # substring scan of the blob so inflected forms ("click" vs
+        # "clicked") still count; multi-word phrases go straight to the
+        # substring scan.
+        token_set = best_match.token_set
+        combined = best_match.search_blob
+        keywords_lc = [kw.lower() for kw in keywords]
+        matched_keywords = sum(
+            (kw in token_set or kw in combined) if ' ' not in kw else (kw in combined)
+            for kw in keywords_lc
+        )
         keyword_ratio = matched_keywords / max(len(keywords), 1)
         
         # Base confidence from event + keyword matching
@@ -488,8 +754,9 @@ Analyze now and provide the comprehensive timeline."""
         evidence_summary = self._build_detailed_evidence(matching_events[:3], keywords)
         
         self.logger.info(
-            f"✓ Step {step.step_number}: Found {len(matching_events)} matches, "
-            f"best at {best_match.timestamp:.1f}s (initial confidence: {base_confidence:.2f})"
+            "✓ Step %d: Found %d matches, best at %.1fs (initial confidence: %.2f)",
+            step.step_number, len(matching_events),
+            best_match.timestamp, base_confidence
         )
         
         return StepEvidence(
@@ -506,26 +773,68 @@ Analyze now and provide the comprehensive timeline."""
             )
         )
     
+    def verify_steps_against_timeline(
+        self,
+        steps: List[TestStep],
+        timeline: VideoTimeline,
+        ocr_data: Dict[int, List[str]]
+    ) -> List[StepEvidence]:
+        """
+        Gather evidence for all steps in one pass over the timeline.
+
+        Steps are still matched in order - each step's minimum timestamp
+        depends on where the previous one was found, so the scan cannot be
+        fully vectorized - but per-timeline work is hoisted: every event's
+        search blob is materialized once up front instead of lazily inside
+        the per-step scans.
+
+        Args:
+            steps: Test steps in execution order
+            timeline: Comprehensive video timeline
+            ocr_data: OCR results for additional text matching
+
+        Returns:
+            StepEvidence per step, in step order
+        """
+        # Force-build the cached blobs in one tight loop so the per-step
+        # event scans below are pure C-level substring tests.
+        for event in timeline.events:
+            event.search_blob  # noqa: B018 - priming cached_property
+
+        evidence_list: List[StepEvidence] = []
+        previous_timestamp: Optional[float] = None
+        for step in steps:
+            evidence = self.verify_step_against_timeline(
+                step=step,
+                timeline=timeline,
+                ocr_data=ocr_data,
+                previous_step_timestamp=previous_timestamp
+            )
+            evidence_list.append(evidence)
+            if evidence.found and evidence.timestamp is not None:
+                previous_timestamp = evidence.timestamp
+        return evidence_list
+
     def _extract_keywords(self, description: str, action: str) -> List[str]:
         """Extract keywords from step description and action."""
         text = f"{description} {action}".lower()
-        
-        # Extract quoted strings (high priority keywords)
-        quoted = re.findall(r'"([^"]*)"', text)
-        quoted = [q.strip() for q in quoted if len(q.strip()) > 2]
-        
-        # Extract regular words (filter stop words)
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to',
-            'for', 'of', 'with', 'is', 'are', 'was', 'were', 'be', 'been',
-            'that', 'this', 'it', 'as', 'by', 'from', 'should', 'will'
-        }
-        words = re.findall(r'\b\w+\b', text)
-        words = [w for w in words if len(w) > 2 and w not in stop_words]
-        
-        # Combine with quoted strings prioritized
-        keywords = quoted + [w for w in words if w not in quoted]
-        
+
+        # One scan over the text: quoted phrases (high priority) and bare
+        # words fall out of the same pass instead of two findall sweeps
+        quoted: List[str] = []
+        words: List[str] = []
+        for match in _KW_RE.finditer(text):
+            phrase = match.group(1)
+            if phrase is not None:
+                phrase = phrase.strip()
+                if len(phrase) > 2:
+                    quoted.append(phrase)
+            elif match.group(2) not in _STOP_WORDS:
+                words.append(match.group(2))
+
+        # Quoted strings prioritized; dict.fromkeys dedups preserving order
+        keywords = list(dict.fromkeys(quoted + words))
+
         return keywords[:15]
     
     def _build_detailed_evidence(
@@ -542,8 +851,18 @@ Analyze now and provide the comprehensive timeline."""
             return "No events found"
         
         evidence_parts = []
+        keywords_lc = [(kw, kw.lower()) for kw in keywords]
         for i, event in enumerate(events[:3], 1):  # Top 3 events
-            matched_kw = [kw for kw in keywords if kw.lower() in event.description.lower()]
+            # Single words hit the cached token set first, then fall back
+            # to a substring test so inflected forms still match; phrases
+            # scan the cached lowercased description directly
+            matched_kw = [
+                kw for kw, kw_lc in keywords_lc
+                if (
+                    kw_lc in event.token_set or kw_lc in event.desc_lower
+                    if ' ' not in kw_lc else kw_lc in event.desc_lower
+                )
+            ]
             evidence_parts.append(
                 f"[{i}] {event.timestamp:.1f}s: {event.description[:100]}... "
                 f"(matched: {', '.join(matched_kw[:3])})"
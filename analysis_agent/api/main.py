@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import warnings
+from dataclasses import asdict
 from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import Response
@@ -186,7 +187,7 @@ async def get_result(task_id: str):
         # V2 Metrics
         "execution_time": report.execution_time,
         "total_llm_calls": report.total_llm_calls,
-        "agent_metrics": [m.model_dump(mode='json') for m in report.agent_metrics],
+        "agent_metrics": [asdict(m) for m in report.agent_metrics],
         "phase_metrics": report.phase_metrics
     }
 
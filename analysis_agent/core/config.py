@@ -20,19 +20,43 @@ class Settings(BaseSettings):
     # Video Processing
     frame_extraction_interval: int = Field(default=2, env="FRAME_EXTRACTION_INTERVAL")
     max_frames_per_video: int = Field(default=50, env="MAX_FRAMES_PER_VIDEO")
+    key_frame_scene_detection: bool = Field(default=True, env="KEY_FRAME_SCENE_DETECTION")
+    key_frame_dedup_threshold: int = Field(default=4, env="KEY_FRAME_DEDUP_THRESHOLD")
+    video_hw_acceleration: bool = Field(default=True, env="VIDEO_HW_ACCELERATION")
+    frame_max_dim: int = Field(default=1280, env="FRAME_MAX_DIM")  # 0 = no resize
+    frame_jpeg_quality: int = Field(default=80, env="FRAME_JPEG_QUALITY")
     
     # OCR Settings
     ocr_languages: str = Field(default="en", env="OCR_LANGUAGES")
     ocr_confidence_threshold: float = Field(default=0.3, env="OCR_CONFIDENCE_THRESHOLD")
+    ocr_batch_size: int = Field(default=8, env="OCR_BATCH_SIZE")
+    ocr_device: str = Field(default="auto", env="OCR_DEVICE")  # "auto", "cuda", "cpu"
+    ocr_workers: int = Field(default=4, env="OCR_WORKERS")
+    ocr_max_image_dim: int = Field(default=1280, env="OCR_MAX_IMAGE_DIM")  # 0 = no resize
     
+    # Planning
+    plan_cache_enabled: bool = Field(default=True, env="PLAN_CACHE_ENABLED")
+    plan_cache_dir: Optional[str] = Field(default=None, env="PLAN_CACHE_DIR")
+
     # Vision Analysis
     vision_max_concurrent: int = Field(default=3, env="VISION_MAX_CONCURRENT")
     vision_batch_size: int = Field(default=5, env="VISION_BATCH_SIZE")
     vision_analyze_all_frames: bool = Field(default=True, env="VISION_ANALYZE_ALL_FRAMES")
+    vision_cache_dir: Optional[str] = Field(default=None, env="VISION_CACHE_DIR")
+    vision_max_image_dim: int = Field(default=0, env="VISION_MAX_IMAGE_DIM")  # 0 = no resize
     
     # Agent Configuration
     agent_temperature: float = Field(default=0.1, env="AGENT_TEMPERATURE")
+    # Steps whose action starts with one of these words (and that contain
+    # no interaction/assertion) skip timeline evidence gathering (empty
+    # string disables the pre-filter)
+    trivial_step_keywords: str = Field(default="wait,sleep,pause,delay", env="TRIVIAL_STEP_KEYWORDS")
     agent_max_retries: int = Field(default=3, env="AGENT_MAX_RETRIES")
+    llm_max_concurrency: int = Field(default=4, env="LLM_MAX_CONCURRENCY")
+    llm_cache_enabled: bool = Field(default=True, env="LLM_CACHE_ENABLED")
+    llm_cache_size: int = Field(default=256, env="LLM_CACHE_SIZE")
+    llm_batch_window_ms: int = Field(default=0, env="LLM_BATCH_WINDOW_MS")
+    llm_batch_max_size: int = Field(default=8, env="LLM_BATCH_MAX_SIZE")
     
     # FastAPI Configuration
     api_host: str = Field(default="0.0.0.0", env="API_HOST")
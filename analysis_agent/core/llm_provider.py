@@ -1,26 +1,139 @@
 from abc import ABC, abstractmethod
 from typing import Optional, List, Dict, Any
+import asyncio
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from google import genai
 from google.genai import types
 from analysis_agent.core.config import Settings
+import functools
+
+# Dedicated executor for blocking LLM SDK calls, so they don't compete for
+# threads with the orchestrator's other to_thread work (frame extraction,
+# OCR). Sized generously; actual concurrency is capped by the agents' LLM
+# semaphore.
+_llm_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_llm_executor() -> ThreadPoolExecutor:
+    global _llm_executor
+    if _llm_executor is None:
+        _llm_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="llm")
+    return _llm_executor
+
 
 class LLMBase(ABC):
     """Abstract base class for LLM providers."""
-    
+
     @abstractmethod
     def generate(self, prompt: str, image_paths: Optional[List[str]] = None) -> str:
         """Generate text from prompt (and optional images)."""
         pass
 
+    async def agenerate(self, prompt: str, image_paths: Optional[List[str]] = None) -> str:
+        """Async variant of generate().
+
+        Providers whose SDK is synchronous inherit this default, which runs
+        the blocking generate() in a dedicated worker thread so callers can
+        overlap multiple LLM calls with asyncio.gather.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_llm_executor(),
+            functools.partial(self.generate, prompt, image_paths),
+        )
+
+    def generate_stream(self, prompt: str, image_paths: Optional[List[str]] = None):
+        """Yield response text incrementally.
+
+        Providers without native streaming inherit this default, which
+        yields the full generate() result as a single chunk, so callers can
+        always consume the streaming interface.
+        """
+        yield self.generate(prompt, image_paths)
+
+    def generate_batch(
+        self,
+        prompts: List[str],
+        image_paths_list: Optional[List[Optional[List[str]]]] = None,
+        max_workers: int = 4,
+    ) -> List[str]:
+        """Generate responses for several prompts in one call.
+
+        Default implementation fans the prompts out over a thread pool,
+        since none of the current providers expose a server-side batch
+        endpoint. Results are returned in prompt order.
+        """
+        if image_paths_list is None:
+            image_paths_list = [None] * len(prompts)
+        if len(prompts) <= 1:
+            return [self.generate(p, imgs) for p, imgs in zip(prompts, image_paths_list)]
+        with ThreadPoolExecutor(max_workers=min(len(prompts), max_workers)) as executor:
+            return list(executor.map(self.generate, prompts, image_paths_list))
+
+@functools.lru_cache(maxsize=256)
+def _load_image_bytes(path: str, mtime_ns: int, size: int, max_dim: int = 0) -> tuple:
+    """Load and encode an image once per content version.
+
+    Keyed on (path, mtime, size, max_dim) so agents repeatedly uploading
+    the same frame (vision pass, verification retries) skip the disk read
+    and PIL re-encode after the first call. A positive max_dim downscales
+    the long edge before encoding - vision models resize server-side
+    anyway, so shipping full-resolution frames only inflates upload time
+    and image-token cost.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if max_dim <= 0 and ext in ('.jpg', '.jpeg', '.png'):
+        # No resize requested and the container is already API-compatible:
+        # ship the file bytes as-is instead of decode + re-encode
+        with open(path, 'rb') as f:
+            data = f.read()
+        return data, 'image/png' if ext == '.png' else 'image/jpeg'
+
+    import PIL.Image
+    import io
+    img = PIL.Image.open(path)
+    fmt = img.format or 'PNG'
+    if max_dim > 0 and max(img.size) > max_dim:
+        img.thumbnail((max_dim, max_dim), PIL.Image.LANCZOS)
+    img_byte_arr = io.BytesIO()
+    img.save(img_byte_arr, format=fmt)
+    return img_byte_arr.getvalue(), f"image/{fmt.lower()}"
+
+
+def preload_image_bytes(paths: List[str], max_workers: int = 8, max_dim: int = 0) -> None:
+    """Warm the image-bytes cache for a batch of frames in parallel.
+
+    Disk reads overlap across threads and PIL's encoder releases the GIL,
+    so priming ahead of generate() turns the serial per-frame load inside
+    the API call into a single parallel pass. Missing files are skipped;
+    generate() re-checks and warns on them. max_dim must match the
+    provider's configured downscale for the primed entries to be hit.
+    """
+    def _prime(path: str) -> None:
+        try:
+            stat = os.stat(path)
+            _load_image_bytes(path, stat.st_mtime_ns, stat.st_size, max_dim)
+        except (OSError, ValueError):
+            pass
+
+    if len(paths) <= 1:
+        for path in paths:
+            _prime(path)
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        list(executor.map(_prime, paths))
+
+
 class GeminiProvider(LLMBase):
     """Provider for Google's Gemini API."""
-    
-    def __init__(self, api_key: str, model_name: str = "gemini-2.5-flash"):
+
+    def __init__(self, api_key: str, model_name: str = "gemini-2.5-flash", max_image_dim: int = 0):
         self.client = genai.Client(api_key=api_key)
         self.model_name = model_name
         self.vision_model_name = "gemini-2.5-flash"  # Use flash for multi-modal
+        self.max_image_dim = max_image_dim
         
     def generate(self, prompt: str, image_paths: Optional[List[str]] = None) -> str:
         max_retries = 5
@@ -37,18 +150,14 @@ class GeminiProvider(LLMBase):
                 contents = []
                 
                 if image_paths:
-                    import PIL.Image
-                    import io
                     for path in image_paths:
-                        if os.path.exists(path):
-                            img = PIL.Image.open(path)
-                            # Convert image to bytes
-                            img_byte_arr = io.BytesIO()
-                            img.save(img_byte_arr, format=img.format or 'PNG')
-                            img_bytes = img_byte_arr.getvalue()
-                            contents.append(types.Part.from_bytes(data=img_bytes, mime_type=f"image/{(img.format or 'PNG').lower()}"))
-                        else:
+                        try:
+                            stat = os.stat(path)
+                        except OSError:
                             print(f"Warning: Image not found at {path}")
+                            continue
+                        img_bytes, mime_type = _load_image_bytes(path, stat.st_mtime_ns, stat.st_size, self.max_image_dim)
+                        contents.append(types.Part.from_bytes(data=img_bytes, mime_type=mime_type))
                 
                 contents.append(prompt)
                 
@@ -82,6 +191,38 @@ class GeminiProvider(LLMBase):
                 print(f"ERROR in GeminiProvider: {e}")
                 return f"Error generating content: {str(e)}"
 
+    def generate_stream(self, prompt: str, image_paths: Optional[List[str]] = None):
+        """Stream response text chunk by chunk from the Gemini API.
+
+        Lets callers surface progress (and eventually begin parsing) while
+        the model is still generating, instead of waiting for the full
+        response.
+        """
+        try:
+            model_to_use = self.vision_model_name if image_paths else self.model_name
+            contents = []
+            if image_paths:
+                for path in image_paths:
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        print(f"Warning: Image not found at {path}")
+                        continue
+                    img_bytes, mime_type = _load_image_bytes(path, stat.st_mtime_ns, stat.st_size, self.max_image_dim)
+                    contents.append(types.Part.from_bytes(data=img_bytes, mime_type=mime_type))
+            contents.append(prompt)
+
+            for chunk in self.client.models.generate_content_stream(
+                model=model_to_use,
+                contents=contents
+            ):
+                if chunk.text:
+                    yield chunk.text
+        except Exception as e:
+            print(f"ERROR in GeminiProvider (stream): {e}")
+            yield f"Error generating content: {str(e)}"
+
+
 class EncapsulatedCLIProvider(LLMBase):
     """Provider that wraps a CLI tool (e.g., Gemini CLI or custom wrapper)."""
     
@@ -127,13 +268,43 @@ class OpenSourceProvider(LLMBase):
 
 class LLMFactory:
     """Factory to create LLM providers based on settings."""
-    
+
+    # Process-wide provider cache so all agents built from the same settings
+    # share one provider instance (and therefore one underlying HTTP client
+    # with its connection pool), instead of paying a fresh TCP+TLS handshake
+    # per agent construction.
+    _provider_cache: Dict[tuple, LLMBase] = {}
+
     @staticmethod
     def create_provider(settings: Settings) -> LLMBase:
         provider_type = getattr(settings, "llm_provider", "gemini").lower()
-        
+
+        cache_key = (
+            provider_type,
+            getattr(settings, "gemini_api_key", None),
+            tuple(getattr(settings, "cli_command", [])),
+            getattr(settings, "vision_max_image_dim", 0),
+        )
+        cached = LLMFactory._provider_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        provider = LLMFactory._build_provider(provider_type, settings)
+        LLMFactory._provider_cache[cache_key] = provider
+        return provider
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop cached providers (e.g. when switching settings in tests)."""
+        LLMFactory._provider_cache.clear()
+
+    @staticmethod
+    def _build_provider(provider_type: str, settings: Settings) -> LLMBase:
         if provider_type == "gemini":
-            return GeminiProvider(settings.gemini_api_key)
+            return GeminiProvider(
+                settings.gemini_api_key,
+                max_image_dim=getattr(settings, "vision_max_image_dim", 0),
+            )
         elif provider_type == "cli":
             # Example: settings.cli_command = ["gemini", "query"]
             cmd = getattr(settings, "cli_command", ["echo"])
@@ -1,9 +1,14 @@
 """Data models for the analysis agent system."""
 
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass
+from functools import cached_property
+from typing import List, Optional, Dict, Any, FrozenSet
 from datetime import datetime
 from enum import Enum
+import re
+
+_TOKEN_RE = re.compile(r'\w+')
 
 
 class StepStatus(str, Enum):
@@ -30,7 +35,14 @@ class TestStep(BaseModel):
 
 
 class VideoFrame(BaseModel):
-    """Information about a video frame."""
+    """Information about a video frame.
+
+    Deliberately a plain mutable BaseModel: pydantic v2 offers no __slots__
+    for models, and the OCR agent assigns ocr_text in place after frames
+    are constructed, which rules out frozen=True. TimelineEvent likewise
+    needs __dict__ for its cached search_blob. The per-instance memory win
+    here would be marginal next to the frame JPEGs on disk.
+    """
     frame_number: int
     timestamp: float
     frame_path: Optional[str] = None
@@ -38,14 +50,22 @@ class VideoFrame(BaseModel):
     vision_description: Optional[str] = None
 
 
-class AgentMetrics(BaseModel):
-    """Metrics for an agent's performance."""
+@dataclass(slots=True, frozen=True)
+class AgentMetrics:
+    """Metrics for an agent's performance.
+
+    A slotted frozen dataclass rather than a BaseModel: these are emitted at
+    the end of every timed operation, and construction skips validation and
+    the per-instance __dict__. Pydantic still handles (de)serialization when
+    nested in DeviationReport/AgentDecision.
+    """
     agent_name: str
     time_taken: float  # seconds
     llm_calls: int
-    tokens_used: Optional[int] = None
     phase: str
-    
+    tokens_used: Optional[int] = None
+
+
 class AgentDecision(BaseModel):
     """Decision made by an agent."""
     agent_name: str
@@ -167,6 +187,31 @@ class TimelineEvent(BaseModel):
     confidence: float = 1.0
     screenshot_path: Optional[str] = None
 
+    @cached_property
+    def search_blob(self) -> str:
+        """Lowercased description + visible text + UI elements, memoized.
+
+        Keyword matching scans this once per event instead of re-joining
+        and re-lowercasing the three fields on every (step, event) pair.
+        """
+        return ' '.join(
+            [self.description, *self.text_visible, *self.ui_elements]
+        ).lower()
+
+    @cached_property
+    def desc_lower(self) -> str:
+        """Lowercased description, memoized for phrase-boost checks."""
+        return self.description.lower()
+
+    @cached_property
+    def token_set(self) -> FrozenSet[str]:
+        """Word tokens of the search blob, memoized.
+
+        Single-word keyword tests become O(1) hash lookups against this
+        set; only multi-word phrases still need a substring scan.
+        """
+        return frozenset(_TOKEN_RE.findall(self.search_blob))
+
 
 class VideoTimeline(BaseModel):
     """Comprehensive timeline of video events from single-pass analysis."""
@@ -182,7 +227,21 @@ class VideoTimeline(BaseModel):
             e for e in self.events
             if abs(e.timestamp - timestamp) <= window
         ]
-    
+
+    @cached_property
+    def _token_index(self) -> Dict[str, List[int]]:
+        """Inverted index: token -> indices of events containing it.
+
+        Built once per timeline, so the per-step keyword lookups in
+        find_events_matching touch only events that actually contain a
+        keyword instead of scanning every event for every keyword.
+        """
+        index: Dict[str, List[int]] = {}
+        for i, event in enumerate(self.events):
+            for token in event.token_set:
+                index.setdefault(token, []).append(i)
+        return index
+
     def find_events_matching(
         self,
         keywords: List[str],
@@ -201,38 +260,51 @@ class VideoTimeline(BaseModel):
             List of matching events sorted by relevance score
         """
         scored_matches = []
-        
-        for event in self.events:
+
+        # Lowercase each keyword once, not once per event
+        keywords_lower = [kw.lower() for kw in keywords]
+        phrase_keywords = [
+            (kw, kw_lower) for kw, kw_lower in zip(keywords, keywords_lower)
+            if len(kw) > 3
+        ]
+
+        # Per-event match counts with substring semantics: a keyword
+        # matches an event when it appears anywhere in the search blob,
+        # so inflected forms ("click" vs "clicked") count. The inverted
+        # index only short-circuits the substring test for events where
+        # the keyword is a whole token; every other event is still
+        # scanned, per event, so an exact-token hit elsewhere in the
+        # timeline never hides a substring match.
+        match_counts: Dict[int, int] = {}
+        index = self._token_index
+        for kw_lower in keywords_lower:
+            hit_set = frozenset(index.get(kw_lower, ())) if ' ' not in kw_lower else frozenset()
+            for i, event in enumerate(self.events):
+                if i in hit_set or kw_lower in event.search_blob:
+                    match_counts[i] = match_counts.get(i, 0) + 1
+
+        min_matches = 2 if require_multiple_matches else 1
+        # Iterate candidates chronologically (event indices follow
+        # timeline order) so the stable score sort below breaks ties by
+        # time, matching the original full-scan behaviour.
+        for i in sorted(match_counts):
+            matches = match_counts[i]
+            if matches < min_matches:
+                continue
+            event = self.events[i]
+
             # Skip events before minimum timestamp (temporal ordering)
             if event.timestamp < min_timestamp:
                 continue
-                
-            desc_lower = event.description.lower()
-            text_lower = ' '.join(event.text_visible).lower()
-            ui_lower = ' '.join(event.ui_elements).lower()
-            combined = f"{desc_lower} {text_lower} {ui_lower}"
-            
-            # Count keyword matches
-            matches = 0
-            matched_keywords = []
-            for kw in keywords:
-                kw_lower = kw.lower()
-                if kw_lower in combined:
-                    matches += 1
-                    matched_keywords.append(kw)
-            
-            # Apply minimum match requirement
-            if require_multiple_matches and matches < 2:
-                continue
-            elif not require_multiple_matches and matches < 1:
-                continue
-            
+
+            desc_lower = event.desc_lower
+
             # Calculate relevance score
             score = matches / max(len(keywords), 1)
-            
+
             # Boost for exact phrase matches in description
-            for kw in keywords:
-                if len(kw) > 3 and kw.lower() in desc_lower:
+            for kw, kw_lower in phrase_keywords:
+                if kw_lower in desc_lower:
                     score += 0.2
             
             # Boost based on event type relevance
@@ -246,9 +318,9 @@ class VideoTimeline(BaseModel):
             
             # Combine with event's own confidence
             final_score = (score + event.confidence) / 2
-            
-            scored_matches.append((event, final_score, matched_keywords))
-        
+
+            scored_matches.append((event, final_score))
+
         # Sort by score (descending) and return events
         scored_matches.sort(key=lambda x: x[1], reverse=True)
         
@@ -1,10 +1,30 @@
+import functools
 import json
 import re
 import logging
 from typing import Optional, Dict, Any, List
 
+try:
+    # C-accelerated decoder - LLM timeline responses are the largest JSON
+    # this codebase parses. Falls back to stdlib json when unavailable.
+    import orjson
+
+    def _loads(text: str) -> Any:
+        return orjson.loads(text)
+except ImportError:  # pragma: no cover
+    _loads = json.loads
+
 logger = logging.getLogger("JSON_UTILS")
 
+_EVENTS_ARRAY_RE = re.compile(r'"events"\s*:\s*\[(.*)', re.DOTALL)
+_BRACE_RE = re.compile(r'[{}]')
+
+
+@functools.lru_cache(maxsize=64)
+def _field_pattern(field: str) -> "re.Pattern[str]":
+    """Compiled extraction pattern for a string field, cached per field name."""
+    return re.compile(f'"{field}"\\s*:\\s*"([^"]*(?:\\\\.[^"]*)*)"')
+
 def clean_json_response(response_text: str) -> str:
     """Clean LLM response to extract JSON string."""
     if not response_text or not response_text.strip():
@@ -38,54 +58,92 @@ def clean_json_response(response_text: str) -> str:
     return text
 
 def repair_json_syntax(json_text: str) -> str:
-    """Attempt to repair common JSON syntax errors."""
-    repaired = json_text
-    
-    # Fix trailing commas: ,] -> ] and ,} -> }
-    repaired = re.sub(r',\s*]', ']', repaired)
-    repaired = re.sub(r',\s*}', '}', repaired)
-    
-    # Fix missing commas between objects: }{ -> },{
-    repaired = re.sub(r'}\s*{', '},{', repaired)
-    
-    # Fix missing commas between array elements: ] [ -> ],[
-    repaired = re.sub(r']\s*\[', '],[', repaired)
-    
-    # Fix missing commas after values at end of line
-    # "value"\s*\n\s*" -> "value",\n"
-    repaired = re.sub(r'"\s*\n\s*"', '",\n"', repaired)
-    repaired = re.sub(r'(\d)\s*\n\s*"', r'\1,\n"', repaired)
-    repaired = re.sub(r'(true|false|null)\s*\n\s*"', r'\1,\n"', repaired)
-    
-    # Ensure proper closing if truncated
-    open_braces = repaired.count('{') - repaired.count('}')
-    open_brackets = repaired.count('[') - repaired.count(']')
-    
-    if open_braces > 0 or open_brackets > 0:
-        # Close unclosed structures
-        repaired += ']' * max(0, open_brackets)
-        repaired += '}' * max(0, open_braces)
-        
-    return repaired
+    """Attempt to repair common JSON syntax errors.
+
+    Single linear scan with a small state machine (string/escape tracking
+    and an open-structure stack) instead of layered regex passes that each
+    re-scan the whole text. Fixes:
+    - trailing commas before a closing bracket/brace
+    - missing commas between adjacent objects/arrays
+    - missing commas between a value and a quoted string on the next line
+    - unclosed braces/brackets from truncated responses
+    """
+    out: List[str] = []
+    pending_ws: List[str] = []  # whitespace run between significant chars
+    open_stack: List[str] = []
+    in_string = False
+    escaped = False
+    last_sig = ''  # last significant char outside strings
+
+    for ch in json_text:
+        if in_string:
+            out.append(ch)
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+                last_sig = '"'
+            continue
+
+        if ch in ' \t\r\n':
+            pending_ws.append(ch)
+            continue
+
+        if ch in ']}' and last_sig == ',':
+            # Trailing comma: drop it (it is the last emitted char)
+            out.pop()
+            last_sig = ''
+        elif (ch == '{' and last_sig == '}') or (ch == '[' and last_sig == ']'):
+            # Adjacent structures with no separator
+            out.append(',')
+        elif ch == '"' and '\n' in pending_ws and (last_sig == '"' or last_sig.isalnum()):
+            # Value ended at end of line, next line starts a string/key
+            out.append(',')
+
+        if pending_ws:
+            out.extend(pending_ws)
+            pending_ws.clear()
+        out.append(ch)
+
+        if ch == '"':
+            in_string = True
+        elif ch in '{[':
+            open_stack.append(ch)
+        elif ch == '}' and open_stack and open_stack[-1] == '{':
+            open_stack.pop()
+        elif ch == ']' and open_stack and open_stack[-1] == '[':
+            open_stack.pop()
+        last_sig = ch
+
+    # Close unclosed structures from truncated output, innermost first
+    for opener in reversed(open_stack):
+        out.append('}' if opener == '{' else ']')
+
+    return ''.join(out)
 
 def _extract_json_objects(text: str) -> List[str]:
-    """Extract complete JSON objects from text using brace matching."""
+    """Extract complete JSON objects from text using brace matching.
+
+    Jumps between braces with a compiled regex instead of a per-character
+    Python loop, so the scan over non-brace text runs in C.
+    """
     objects = []
     depth = 0
     start = -1
-    
-    for i, char in enumerate(text):
-        if char == '{':
+
+    for match in _BRACE_RE.finditer(text):
+        if match.group() == '{':
             if depth == 0:
-                start = i
+                start = match.start()
             depth += 1
-        elif char == '}':
+        else:
             depth -= 1
             if depth == 0 and start >= 0:
-                obj_str = text[start:i+1]
-                objects.append(obj_str)
+                objects.append(text[start:match.end()])
                 start = -1
-    
+
     return objects
 
 def extract_partial_json(json_text: str, fields: List[str]) -> Dict[str, Any]:
@@ -95,20 +153,20 @@ def extract_partial_json(json_text: str, fields: List[str]) -> Dict[str, Any]:
     result = {}
     for field in fields:
         # Simple regex for string fields
-        match = re.search(f'"{field}"\\s*:\\s*"([^"]*(?:\\\\.[^"]*)*)"', json_text)
+        match = _field_pattern(field).search(json_text)
         if match:
             result[field] = match.group(1).replace('\\"', '"')
-    
+
     # Try to extract arrays if requested
     if "events" in fields:
-        events_match = re.search(r'"events"\s*:\s*\[(.*)', json_text, re.DOTALL)
+        events_match = _EVENTS_ARRAY_RE.search(json_text)
         if events_match:
             events_content = events_match.group(1)
             objects = _extract_json_objects(events_content)
             result["events"] = []
             for obj_str in objects:
                 try:
-                    result["events"].append(json.loads(obj_str))
+                    result["events"].append(_loads(obj_str))
                 except:
                     continue
                     
@@ -139,29 +197,29 @@ def try_parse_json(json_text: str) -> Optional[Any]:
         
     # Strategy 1: Direct parsing
     try:
-        return json.loads(json_text)
-    except json.JSONDecodeError:
+        return _loads(json_text)
+    except ValueError:
         pass
         
     # Strategy 2: Clean and try
     cleaned = clean_json_response(json_text)
     try:
-        return json.loads(cleaned)
-    except json.JSONDecodeError:
+        return _loads(cleaned)
+    except ValueError:
         pass
         
     # Strategy 3: Repair syntax and try
     repaired = repair_json_syntax(cleaned)
     try:
-        return json.loads(repaired)
-    except json.JSONDecodeError:
+        return _loads(repaired)
+    except ValueError:
         pass
         
     # Strategy 4: Truncate and try
     truncated = truncate_to_valid_json(cleaned)
     if truncated:
         try:
-            return json.loads(truncated)
+            return _loads(truncated)
         except:
             pass
             